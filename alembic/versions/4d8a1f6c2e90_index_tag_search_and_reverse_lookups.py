@@ -0,0 +1,48 @@
+"""index tag search and reverse lookups
+
+Revision ID: 4d8a1f6c2e90
+Revises: 9c4e2b7a1d53
+Create Date: 2026-10-15 23:04:12.538114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8a1f6c2e90"
+down_revision: Union[str, Sequence[str], None] = "9c4e2b7a1d53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # list_tags searches with ILIKE, which the unique B-tree on name cannot serve
+    op.create_index(
+        "idx_tag_name_trgm",
+        "tags",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    # idx_word_tag duplicated the (word_id, tag_id) primary key; index the
+    # tag side instead so tag deletes and per-tag lookups avoid a scan
+    op.drop_index("idx_word_tag", table_name="word_tags")
+    op.create_index("idx_word_tag_tag_id", "word_tags", ["tag_id"], unique=False)
+    # Relation lists filter on word_id_1 OR word_id_2; the primary key only
+    # leads with word_id_1
+    op.create_index(
+        "idx_word_relation_word_id_2", "word_relations", ["word_id_2"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_word_relation_word_id_2", table_name="word_relations")
+    op.drop_index("idx_word_tag_tag_id", table_name="word_tags")
+    op.create_index("idx_word_tag", "word_tags", ["word_id", "tag_id"], unique=False)
+    op.drop_index("idx_tag_name_trgm", table_name="tags")
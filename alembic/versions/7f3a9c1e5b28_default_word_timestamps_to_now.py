@@ -0,0 +1,33 @@
+"""default word timestamps to now() on the server
+
+Revision ID: 7f3a9c1e5b28
+Revises: e2a9d4b8c613
+Create Date: 2026-10-16 01:05:41.218734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3a9c1e5b28"
+down_revision: Union[str, Sequence[str], None] = "e2a9d4b8c613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Inserts now omit the timestamps and let the database fill them in;
+    # setting a default only touches the catalog, not existing rows
+    op.alter_column("words", "created_at", server_default=sa.text("now()"))
+    op.alter_column("words", "updated_at", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("words", "updated_at", server_default=None)
+    op.alter_column("words", "created_at", server_default=None)
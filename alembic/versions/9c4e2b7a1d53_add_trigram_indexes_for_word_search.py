@@ -0,0 +1,47 @@
+"""add trigram indexes for word search
+
+Revision ID: 9c4e2b7a1d53
+Revises: abd75b163d91
+Create Date: 2026-10-15 10:12:41.218305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e2b7a1d53"
+down_revision: Union[str, Sequence[str], None] = "abd75b163d91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # B-tree indexes cannot serve ILIKE; pg_trgm GIN indexes serve both the
+    # prefix search in list_words and substring patterns
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_word_text_trgm",
+        "words",
+        ["word_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"word_text": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_form_text_trgm",
+        "word_forms",
+        ["form_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"form_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_form_text_trgm", table_name="word_forms")
+    op.drop_index("idx_word_text_trgm", table_name="words")
@@ -0,0 +1,30 @@
+"""add word_text, id index for cursor pages
+
+Revision ID: b71e3c9a5f02
+Revises: 4d8a1f6c2e90
+Create Date: 2026-10-15 23:41:08.102377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e3c9a5f02"
+down_revision: Union[str, Sequence[str], None] = "4d8a1f6c2e90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves ORDER BY word_text, id and the (word_text, id) > (...) seek of
+    # alphabetical cursor pages in list_words
+    op.create_index("idx_word_text_id", "words", ["word_text", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_word_text_id", table_name="words")
@@ -0,0 +1,37 @@
+"""drop redundant word_text and form_text indexes
+
+Revision ID: c5d81e4f9a37
+Revises: 7f3a9c1e5b28
+Create Date: 2026-10-16 01:42:09.553180
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d81e4f9a37"
+down_revision: Union[str, Sequence[str], None] = "7f3a9c1e5b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # words.word_text had two single-column B-trees on top of uq_word_language
+    # and idx_word_text_id, which both lead with word_text; word_forms.form_text
+    # was indexed twice. Each copy only added write cost
+    op.drop_index("idx_word_text_lower", table_name="words")
+    op.drop_index(op.f("ix_words_word_text"), table_name="words")
+    op.drop_index(op.f("ix_word_forms_form_text"), table_name="word_forms")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_word_forms_form_text"), "word_forms", ["form_text"], unique=False
+    )
+    op.create_index(op.f("ix_words_word_text"), "words", ["word_text"], unique=False)
+    op.create_index("idx_word_text_lower", "words", ["word_text"], unique=False)
@@ -0,0 +1,63 @@
+"""add lower() text_pattern_ops indexes for prefix search
+
+Also drops the tag name trigram index that prefix-only tag search left unused.
+
+Revision ID: e2a9d4b8c613
+Revises: b71e3c9a5f02
+Create Date: 2026-10-16 00:12:53.664210
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a9d4b8c613"
+down_revision: Union[str, Sequence[str], None] = "b71e3c9a5f02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Prefix search runs lower(col) LIKE 'x%'; under a non-C collation only a
+    # text_pattern_ops B-tree can turn that into a range scan
+    op.create_index(
+        "idx_word_text_lower_pattern",
+        "words",
+        [sa.text("lower(word_text) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "idx_form_text_lower_pattern",
+        "word_forms",
+        [sa.text("lower(form_text) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "idx_tag_name_lower_pattern",
+        "tags",
+        [sa.text("lower(name) text_pattern_ops")],
+        unique=False,
+    )
+    # Tag search is prefix-only now and served by the index above, so nothing
+    # uses the trigram index any more
+    op.drop_index("idx_tag_name_trgm", table_name="tags")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "idx_tag_name_trgm",
+        "tags",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index("idx_tag_name_lower_pattern", table_name="tags")
+    op.drop_index("idx_form_text_lower_pattern", table_name="word_forms")
+    op.drop_index("idx_word_text_lower_pattern", table_name="words")
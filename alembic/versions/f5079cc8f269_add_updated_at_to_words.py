@@ -8,7 +8,7 @@ Create Date: 2025-11-30 18:23:00.700938
 
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -19,18 +19,42 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Rows backfilled per transaction; keeps each lock window and WAL burst small
+BACKFILL_BATCH_SIZE = 5000
+
+
 def upgrade() -> None:
     """Upgrade schema."""
-    # Add updated_at column to words table
-    # Set default to created_at for existing rows, then change to now() for new rows
+    # Add updated_at column to words table in three steps so no single statement
+    # rewrites the whole table under an ACCESS EXCLUSIVE lock:
+    # 1. add as nullable, 2. backfill existing rows from created_at in batches,
+    # 3. set the now() default and NOT NULL for new rows
     op.add_column(
         "words",
-        sa.Column(
-            "updated_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.func.now(),
-        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    backfill = sa.text(
+        "UPDATE words SET updated_at = created_at "
+        "WHERE id IN (SELECT id FROM words WHERE updated_at IS NULL LIMIT :limit)"
+    )
+    if context.is_offline_mode():
+        # No row counts in --sql mode, emit a single unbounded backfill
+        op.execute("UPDATE words SET updated_at = created_at WHERE updated_at IS NULL")
+    else:
+        with op.get_context().autocommit_block():
+            bind = op.get_bind()
+            while True:
+                result = bind.execute(backfill, {"limit": BACKFILL_BATCH_SIZE})
+                if result.rowcount == 0:
+                    break
+
+    op.alter_column(
+        "words",
+        "updated_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
     )
 
 
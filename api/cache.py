@@ -0,0 +1,145 @@
+"""Optional Redis cache for read-heavy dictionary responses.
+
+Enabled only when ``REDIS_URL`` is set; otherwise cached functions call straight
+through to the database. Entries expire after ``CACHE_TTL`` seconds and writes
+invalidate their prefix once committed, so the TTL only bounds staleness from
+changes made outside these services.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+from typing import TYPE_CHECKING, Any, Final
+
+from redis import Redis, RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from api.utils import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import BaseModel
+
+# Seconds a cached response stays valid
+CACHE_TTL: Final = int(os.getenv("CACHE_TTL", "30"))
+
+_REDIS_URL = os.getenv("REDIS_URL")
+_client: Redis | None = Redis.from_url(_REDIS_URL) if _REDIS_URL else None
+
+# Session.info key holding prefixes to invalidate when the transaction commits
+_PENDING: Final = "cache_invalidate"
+
+
+def cached[**P, M: BaseModel](
+    prefix: str, model: type[M], ttl: int = CACHE_TTL
+) -> Callable[[Callable[P, M]], Callable[P, M]]:
+    """Cache a service function's response model in Redis.
+
+    The key is ``prefix`` followed by the call's arguments by parameter name,
+    skipping the leading database session, so positional and keyword calls share
+    an entry. Redis errors are logged and fall back to the database.
+
+    Args:
+        prefix: Key prefix, shared with ``invalidate`` (e.g., ``"tags:list"``)
+        model: Response schema used to decode cached JSON
+        ttl: Seconds before an entry expires
+
+    Returns:
+        Decorator for functions taking the session as first argument
+    """
+
+    def decorator(func: Callable[P, M]) -> Callable[P, M]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+            if _client is None:
+                return func(*args, **kwargs)
+
+            key = _cache_key(prefix, signature, args, kwargs)
+            try:
+                hit = _client.get(key)
+            except RedisError:
+                logger.warning("Cache read failed for %s", key, exc_info=True)
+                return func(*args, **kwargs)
+            if hit is not None:
+                return model.model_validate_json(hit)
+
+            result = func(*args, **kwargs)
+            try:
+                _ = _client.set(key, result.model_dump_json(), ex=ttl)
+            except RedisError:
+                logger.warning("Cache write failed for %s", key, exc_info=True)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*prefixes: str) -> None:
+    """Drop every cached entry under the given key prefixes.
+
+    Args:
+        *prefixes: Prefixes passed to ``cached`` (``"tags"`` also covers
+            ``"tags:list"`` and ``"tags:get"``)
+    """
+    if _client is None:
+        return
+
+    try:
+        for prefix in prefixes:
+            keys = list(_client.scan_iter(match=f"{prefix}:*", count=500))
+            if keys:
+                _ = _client.unlink(*keys)
+    except RedisError:
+        logger.warning("Cache invalidation failed for %s", prefixes, exc_info=True)
+
+
+def invalidate_on_commit(db: Session, *prefixes: str) -> None:
+    """Invalidate the given prefixes once the session's transaction commits.
+
+    For writes whose caller owns the commit: invalidating right away would let a
+    concurrent read re-cache the data the uncommitted write is replacing.
+
+    Args:
+        db: Session whose next commit publishes the write
+        *prefixes: Prefixes passed to ``cached``
+    """
+    pending: set[str] = db.info.setdefault(_PENDING, set())
+    pending.update(prefixes)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    """Drop the entries queued by ``invalidate_on_commit``."""
+    prefixes: set[str] = session.info.pop(_PENDING, set())
+    if prefixes:
+        invalidate(*prefixes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    """Forget queued invalidations; a rolled-back write changed nothing."""
+    _ = session.info.pop(_PENDING, None)
+
+
+def _cache_key(
+    prefix: str,
+    signature: inspect.Signature,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """Build a cache key from a prefix and call arguments.
+
+    Arguments are bound to ``signature`` first so ``f(db, 1)`` and
+    ``f(db, tag_id=1)`` map to the same key; the session is left out.
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    values = list(bound.arguments.items())[1:]
+    return ":".join([prefix, *(f"{name}={value!r}" for name, value in values)])
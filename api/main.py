@@ -4,27 +4,46 @@ Inference-only FastAPI backend that loads pre-trained models from Hugging Face H
 Models are trained locally and uploaded to HF Hub separately.
 """
 
+import asyncio
+import importlib.util
+import os
+import time
+
 from dotenv import load_dotenv
 
 # Load environment variables BEFORE any imports that depend on them
 # This must be called before importing db module (which reads DATABASE_URL)
 _ = load_dotenv()
 
+# Keep the HF Hub cache on the persistent volume in production so restarts reuse
+# downloaded weights. huggingface_hub reads these at import time, so they must be
+# set before hf_hub is imported.
+if os.getenv("ENV") == "production":
+    _ = os.environ.setdefault("HF_HOME", "/app/models/huggingface")
+    _ = os.environ.setdefault("HUGGINGFACE_HUB_CACHE", f"{os.environ['HF_HOME']}/hub")
+
+# Route cold-cache model downloads through the Rust hf_transfer backend when the
+# wheel is installed; huggingface_hub raises on download if it is enabled but missing.
+if importlib.util.find_spec("hf_transfer") is not None:
+    _ = os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # ruff: noqa: E402 - imports after load_dotenv() are intentional
-import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Final
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 
 from api.routes import inference
 from api.routes.dictionary import router as dictionary_router
 from api.state import state
 from api.utils import logger
-from db import engine
-from hf_hub import ModelManager, get_default_model
+from db import async_engine, warm_pool
+from hf_hub import get_cache_dir, get_default_model, get_manager
 from schemas import HealthCheck
 
 
@@ -40,13 +59,13 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     """
     # Check database connection (tables should be created via migrations)
     try:
-        with engine.connect() as conn:
+        async with async_engine.connect() as conn:
             # Check if dictionary tables exist
             query = (
                 "SELECT EXISTS ("
                 "SELECT FROM information_schema.tables WHERE table_name = 'words')"
             )
-            result = conn.execute(text(query))
+            result = await conn.execute(text(query))
             tables_exist = result.scalar()
 
             if tables_exist:
@@ -54,6 +73,10 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
             else:
                 logger.warning("Database tables not found!")
                 logger.warning("Run migrations: make upgrade")
+
+        # Sync pool used by the dictionary routes; warm it off the event loop
+        warmed = await asyncio.to_thread(warm_pool)
+        logger.info("✓ Warmed %d pooled database connections", warmed)
     except Exception as e:
         logger.warning("Database connection check failed: %s", e)
         logger.warning("Dictionary endpoints may not work without database access")
@@ -62,9 +85,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     # Load model from Hugging Face Hub
     try:
         logger.info("Loading model from Hugging Face Hub...")
+        logger.info("  Cache dir: %s", get_cache_dir().resolve())
         model_name = get_default_model()
-        manager = ModelManager()
-        state.network = manager.load_model(model_name)
+        state.network = get_manager().load_model(model_name)
         logger.info("✓ Loaded model: %s", model_name)
         logger.info("  Architecture: %s", state.network.sizes)
         logger.info("  Activation: %s", state.network.activation_name)
@@ -77,6 +100,8 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
 
     yield
 
+    await async_engine.dispose()
+
 
 app = FastAPI(
     title="Neural Network Inference API",
@@ -86,6 +111,8 @@ app = FastAPI(
     ),
     version="2.0.0",
     lifespan=lifespan,
+    # Float-heavy payloads (/predict probabilities, /activations) encode faster in C
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -98,30 +125,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (numeric JSON from /activations compresses well);
+# level 5 keeps most of the ratio at a fraction of level 9's CPU cost
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(inference.router)
 app.include_router(dictionary_router)
 
 
-@app.get("/healthz", response_model=HealthCheck)
-def health_check() -> HealthCheck:
-    """Check API health, model loading status, and database connectivity.
+# Cached result of the last database probe, shared across health checks
+_DB_PROBE_TTL: Final = 5.0
+_db_probe_lock = asyncio.Lock()
+_db_state: dict[str, bool | float] = {"ok": False, "ts": float("-inf")}
+
+
+async def _probe_database() -> bool:
+    """Run ``SELECT 1`` on the async engine without blocking the event loop.
 
     Returns:
-        Health check response with system status
+        True if the database answered
     """
-    # Check database connectivity
-    database_connected = False
     try:
-        with engine.connect() as conn:
-            _ = conn.execute(text("SELECT 1"))
-            database_connected = True
+        async with async_engine.connect() as conn:
+            _ = await conn.execute(text("SELECT 1"))
     except Exception:
         logger.exception("Database health check failed")
-        database_connected = False
+        return False
+    return True
+
 
+async def _database_connected() -> bool:
+    """Return database connectivity, re-probing at most once per TTL window.
+
+    Load balancer health pings arrive far more often than connectivity changes,
+    so the last probe result is reused for ``_DB_PROBE_TTL`` seconds. Once it
+    expires ``SELECT 1`` is always issued: an idle pooled connection says nothing
+    about whether the server is still up.
+
+    Returns:
+        True if the last probe reached the database
+    """
+    async with _db_probe_lock:
+        now = time.monotonic()
+        if now - _db_state["ts"] < _DB_PROBE_TTL:
+            return bool(_db_state["ok"])
+
+        ok = await _probe_database()
+        _db_state["ok"] = ok
+        _db_state["ts"] = now
+        return ok
+
+
+@app.get("/healthz", response_model=HealthCheck)
+async def health_check() -> HealthCheck:
+    """Check API health, model loading status, and database connectivity.
+
+    Returns:
+        Health check response with system status
+    """
     return HealthCheck(
         status="healthy",
         network_loaded=state.network is not None,
-        database_connected=database_connected,
+        database_connected=await _database_connected(),
     )
@@ -10,8 +10,5 @@ from api.routes.dictionary import definitions, examples, relations, tags, words
 router = APIRouter(prefix="/v1/dictionary", tags=["dictionary"])
 
 # Include sub-routers
-router.include_router(words.router)
-router.include_router(definitions.router)
-router.include_router(examples.router)
-router.include_router(tags.router)
-router.include_router(relations.router)
+for _module in (words, definitions, examples, tags, relations):
+    router.include_router(_module.router)
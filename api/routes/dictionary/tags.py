@@ -30,11 +30,21 @@ def create_tag(
 def list_tags(
     db: Annotated[Session, Depends(get_db)],
     search: Annotated[str | None, Query(description="Search tag name")] = None,
-    page: Annotated[int, Query(ge=1)] = 1,
+    page: Annotated[
+        int, Query(ge=1, description="Page number (ignored when after_id is set)")
+    ] = 1,
     page_size: Annotated[int, Query(ge=1, le=1000)] = 100,
+    after_id: Annotated[
+        int | None,
+        Query(ge=0, description="Keyset cursor: next_cursor from the previous page"),
+    ] = None,
 ) -> PaginatedTags:
-    """List or search tags."""
-    return tag_service.list_tags(db, search, page, page_size)
+    """List or search tags.
+
+    Pass ``after_id`` (start with 0) to page by id with a keyset cursor instead
+    of ``page``; each response's ``next_cursor`` is the next ``after_id``.
+    """
+    return tag_service.list_tags(db, search, page, page_size, after_id)
 
 
 @router.get("/{tag_id}", response_model=TagOut)
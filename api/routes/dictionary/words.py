@@ -16,6 +16,7 @@ from schemas.dictionary import (
     PaginatedResponse,
     PaginatedWords,
     WordCreate,
+    WordCreateBatch,
     WordFull,
     WordOut,
     WordUpdate,
@@ -30,7 +31,7 @@ router = APIRouter(prefix="/words", tags=["words"])
     status_code=201,
 )
 def create_words(
-    word_data: WordCreate | list[WordCreate],
+    word_data: WordCreate | WordCreateBatch,
     db: Annotated[Session, Depends(get_db)],
 ) -> WordOut | WordFull | list[WordOut] | list[WordFull]:
     """Create one or more words with optional nested data.
@@ -39,6 +40,9 @@ def create_words(
         Simple: {"word_text": "hello", "language_code": "en"}
         Nested: {..., "definitions": [...], "tag_ids": [1, 2]}
         Multiple: [{"word_text": "word1", ...}, {"word_text": "word2", ...}]
+
+    A list (up to 10,000 words) is written in one transaction with one
+    multi-row INSERT per table and chunk, so it suits dictionary bulk loads.
     """
     return word_service.create_words(db, word_data)
 
@@ -46,7 +50,13 @@ def create_words(
 @router.get("", response_model=PaginatedWords | PaginatedResponse[WordFull])
 def list_words(
     db: Annotated[Session, Depends(get_db)],
-    search: Annotated[str | None, Query(description="Search word text")] = None,
+    search: Annotated[
+        str | None, Query(max_length=64, description="Search word text")
+    ] = None,
+    contains: Annotated[
+        bool,
+        Query(description="Match search anywhere in the text instead of as a prefix"),
+    ] = False,
     language: Annotated[
         str | None, Query(description="Filter by language code")
     ] = None,
@@ -55,10 +65,29 @@ def list_words(
         bool, Query(description="Include definitions")
     ] = False,
     include_tags: Annotated[bool, Query(description="Include tags")] = False,
-    page: Annotated[int, Query(ge=1)] = 1,
+    page: Annotated[
+        int, Query(ge=1, description="Page number (ignored when after_id is set)")
+    ] = 1,
     page_size: Annotated[int, Query(ge=1, le=1000)] = 100,
+    after_id: Annotated[
+        int | None,
+        Query(ge=0, description="Keyset cursor: next_cursor from the previous page"),
+    ] = None,
+    cursor: Annotated[
+        str | None,
+        Query(
+            max_length=512,
+            description="Alphabetical cursor: next_page_cursor from the previous page",
+        ),
+    ] = None,
 ) -> PaginatedWords | PaginatedResponse[WordFull]:
-    """List or search words (returns basic fields by default)."""
+    """List or search words (returns basic fields by default).
+
+    Pass ``after_id`` (start with 0) to page by id with a keyset cursor instead
+    of ``page``; each response's ``next_cursor`` is the next ``after_id``.
+    Alphabetical pages return ``next_page_cursor``; pass it as ``cursor`` to
+    seek to the next page without OFFSET (``total`` is then null).
+    """
     return word_service.list_words(
         db,
         search,
@@ -68,6 +97,9 @@ def list_words(
         include_all,
         include_definitions,
         include_tags,
+        after_id,
+        cursor,
+        contains,
     )
 
 
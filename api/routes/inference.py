@@ -1,25 +1,70 @@
 """Inference API routes for neural network predictions."""
 
+from array import array
+from collections.abc import Iterator
+from itertools import chain
+from typing import Annotated, Final, cast
+
 import numpy as np
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
 
 from api.state import state
+from api.utils import json_body, json_body_openapi
+from neural_networks.core import NDArrayFloat
 from schemas.inference import (
+    PIXEL_COUNT,
     ActivationsInput,
     ActivationsOutput,
+    BatchPredictionInput,
+    BatchPredictionOutput,
+    ImageInput,
     PredictionInput,
     PredictionOutput,
 )
 
 router = APIRouter(prefix="/v1", tags=["inference"])
 
+NDJSON_MEDIA_TYPE: Final = "application/x-ndjson"
+
+
+def _input_pixels(input_data: ImageInput) -> NDArrayFloat:
+    """Convert request pixels to a (784,) float32 vector.
+
+    A ``pixels_b64`` blob is wrapped as a read-only view with no per-element
+    work. A ``pixels`` list is packed by ``array('f', ...)`` in a tight C loop
+    and wrapped the same way, skipping NumPy's per-element dtype discovery.
+
+    Args:
+        input_data: Validated image input (exactly one encoding is set)
+
+    Returns:
+        Input vector
 
-@router.post("/predict", response_model=PredictionOutput)
-def predict(input_data: PredictionInput) -> PredictionOutput:
+    Raises:
+        ValueError: If neither encoding is set (the schema validator prevents it)
+    """
+    if input_data.pixels_b64 is not None:
+        return np.frombuffer(input_data.pixels_b64, dtype="<f4")
+    if input_data.pixels is None:
+        msg = "Provide exactly one of 'pixels' or 'pixels_b64'"
+        raise ValueError(msg)
+    return np.frombuffer(array("f", input_data.pixels), dtype=np.float32)
+
+
+@router.post(
+    "/predict",
+    response_model=PredictionOutput,
+    openapi_extra=json_body_openapi(PredictionInput),
+)
+def predict(
+    input_data: Annotated[PredictionInput, Depends(json_body(PredictionInput))],
+) -> PredictionOutput:
     """Get network prediction for input image.
 
     Args:
-        input_data: Input pixels (784-dimensional)
+        input_data: Input pixels (784-dimensional), as a list or base64 float32
 
     Returns:
         Prediction with confidence scores
@@ -34,28 +79,113 @@ def predict(input_data: PredictionInput) -> PredictionOutput:
         )
 
     try:
-        x = np.array(input_data.pixels, dtype=np.float64).reshape(784, 1)
-        output = state.network.feedforward(x)
+        output = state.network.feedforward(_input_pixels(input_data))
 
-        probabilities = output.flatten().tolist()
-        predicted_digit = int(np.argmax(output))
-        confidence = float(output[predicted_digit, 0])
+        predicted_digit = int(output.argmax())
 
         return PredictionOutput(
             predicted_digit=predicted_digit,
-            confidence=confidence,
-            probabilities=probabilities,
+            confidence=float(output[predicted_digit]),
+            # tolist() is typed as any nesting depth; a (10,) output is flat
+            probabilities=cast("list[float]", output.tolist()),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Prediction failed: {e}") from e
+
+
+@router.post(
+    "/predict/batch",
+    response_model=BatchPredictionOutput,
+    openapi_extra=json_body_openapi(BatchPredictionInput),
+)
+def predict_batch(
+    input_data: Annotated[
+        BatchPredictionInput, Depends(json_body(BatchPredictionInput))
+    ],
+) -> BatchPredictionOutput:
+    """Get network predictions for a batch of input images.
+
+    Inputs are stacked into a (784, N) matrix so each layer runs as a single
+    matrix-matrix product instead of N matrix-vector products.
+
+    Args:
+        input_data: Batch of input pixels (784-dimensional each)
+
+    Returns:
+        Predictions with confidence scores, in input order
+
+    Raises:
+        HTTPException: If network doesn't exist
+    """
+    if state.network is None:
+        raise HTTPException(
+            status_code=503,
+            detail="No model loaded. Check server configuration.",
+        )
+
+    try:
+        packed = array("f", chain.from_iterable(input_data.pixels))
+        x = np.frombuffer(packed, dtype=np.float32).reshape(-1, PIXEL_COUNT).T
+        output = state.network.feedforward(x)
+
+        predicted_digits = output.argmax(axis=0)
+        confidences = output[predicted_digits, np.arange(output.shape[1])]
+
+        return BatchPredictionOutput(
+            predictions=[
+                PredictionOutput(
+                    predicted_digit=digit,
+                    confidence=confidence,
+                    probabilities=probabilities,
+                )
+                for digit, confidence, probabilities in zip(
+                    predicted_digits.tolist(),
+                    cast("list[float]", confidences.tolist()),
+                    cast("list[list[float]]", output.T.tolist()),
+                    strict=True,
+                )
+            ],
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction failed: {e}") from e
 
 
-@router.post("/activations", response_model=ActivationsOutput)
-def get_activations(input_data: ActivationsInput) -> ActivationsOutput:
+def _stream_activations(activations: list[NDArrayFloat]) -> Iterator[bytes]:
+    """Serialize activations as NDJSON, one layer per line.
+
+    Args:
+        activations: Activation arrays, input layer first
+
+    Yields:
+        ``{"layer": i, "values": [...]}`` lines
+    """
+    for i, act in enumerate(activations):
+        yield (
+            orjson.dumps(
+                {"layer": i, "values": act.ravel()}, option=orjson.OPT_SERIALIZE_NUMPY
+            )
+            + b"\n"
+        )
+
+
+@router.post(
+    "/activations",
+    response_model=ActivationsOutput,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+    openapi_extra=json_body_openapi(ActivationsInput),
+)
+def get_activations(
+    input_data: Annotated[ActivationsInput, Depends(json_body(ActivationsInput))],
+    accept: Annotated[str | None, Header()] = None,
+) -> ActivationsOutput | StreamingResponse:
     """Get all layer activations for visualization.
 
+    Clients sending ``Accept: application/x-ndjson`` get one line per layer,
+    streamed as each layer is serialized, instead of a single JSON document.
+
     Args:
-        input_data: Input pixels
+        input_data: Input pixels, as a list or base64 float32
+        accept: Accept header, used to opt into NDJSON streaming
 
     Returns:
         Activations for all layers
@@ -70,11 +200,15 @@ def get_activations(input_data: ActivationsInput) -> ActivationsOutput:
         )
 
     try:
-        x = np.array(input_data.pixels, dtype=np.float64).reshape(784, 1)
-        activations = state.network.get_all_activations(x)
+        activations = state.network.get_all_activations(_input_pixels(input_data))
+
+        if accept is not None and NDJSON_MEDIA_TYPE in accept:
+            return StreamingResponse(
+                _stream_activations(activations), media_type=NDJSON_MEDIA_TYPE
+            )
 
         return ActivationsOutput(
-            activations=[act.flatten().tolist() for act in activations],
+            activations=[act.ravel().tolist() for act in activations],
             layer_sizes=state.network.sizes,
         )
     except Exception as e:
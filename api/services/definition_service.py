@@ -2,12 +2,36 @@
 
 from __future__ import annotations
 
-from fastapi import HTTPException
-from sqlalchemy.orm import Session, joinedload
+from typing import TYPE_CHECKING, Any, Final
 
-from api.utils import handle_db_error
-from db.models.dictionary import Definition, Example, Word
-from schemas.dictionary import DefinitionNested, DefinitionOut
+from fastapi import HTTPException
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from api.utils import (
+    construct_row,
+    construct_rows,
+    handle_db_error,
+    insert_where,
+    model_columns,
+)
+from db.models.dictionary import Definition, Example, Word, touch_word
+from schemas.dictionary import DefinitionNested, DefinitionOut, ExampleOut
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Row
+
+# Scalar columns of DefinitionOut (examples are loaded separately)
+DEFINITION_COLUMNS: Final = (
+    Definition.id,
+    Definition.word_id,
+    Definition.definition_text,
+    Definition.part_of_speech,
+    Definition.order,
+)
 
 
 def create_definition(
@@ -15,47 +39,52 @@ def create_definition(
     word_id: int,
     definition: DefinitionNested,
 ) -> DefinitionOut:
-    """Add a definition to an existing word."""
+    """Add a definition to an existing word.
+
+    The word check runs inside the INSERT (``WHERE EXISTS``), so the definition
+    and its examples take two statements and no verification SELECT.
+    """
     try:
-        # Verify word exists
-        word = db.query(Word).filter(Word.id == word_id).first()
-        if not word:
+        row = db.execute(
+            insert_where(
+                insert(Definition),
+                {
+                    "word_id": word_id,
+                    "definition_text": definition.definition_text,
+                    "part_of_speech": definition.part_of_speech,
+                    "order": definition.order,
+                },
+                exists().where(Word.id == word_id),
+            ).returning(*DEFINITION_COLUMNS)
+        ).first()
+        if row is None:
             raise HTTPException(status_code=404, detail=f"Word {word_id} not found")
 
-        # Create definition
-        db_definition = Definition(
-            word_id=word_id,
-            definition_text=definition.definition_text,
-            part_of_speech=definition.part_of_speech,
-            order=definition.order,
-        )
-        db.add(db_definition)
-        db.flush()
-
-        # Create examples
-        for example_data in definition.examples:
-            db_example = Example(
-                definition_id=db_definition.id,
-                example_text=example_data.example_text,
-                source=example_data.source,
-            )
-            db.add(db_example)
+        example_rows = _insert_examples(db, row.id, definition)
 
+        # Bulk statements bypass the ORM listeners that bump Word.updated_at
+        touch_word(word_id, db)
         db.commit()
-        db.refresh(db_definition)
 
-        # Load with examples
-        definition_with_examples = (
-            db.query(Definition)
-            .options(joinedload(Definition.examples))
-            .filter(Definition.id == db_definition.id)
-            .first()
+        return construct_row(
+            DefinitionOut, row, examples=construct_rows(ExampleOut, example_rows)
         )
 
-        return DefinitionOut.model_validate(definition_with_examples)
-
     except HTTPException:
         raise
+    except IntegrityError as e:
+        db.rollback()
+        # Word deleted concurrently between the EXISTS check and the FK check
+        if not db.scalar(select(exists().where(Word.id == word_id))):
+            raise HTTPException(
+                status_code=404, detail=f"Word {word_id} not found"
+            ) from e
+        # The word is there, so uq_word_definition_order rejected the order
+        raise HTTPException(
+            status_code=409,
+            detail=f"Word {word_id} already has a definition with order "
+            f"{definition.order}",
+        ) from e
     except Exception:
         handle_db_error("create definition", db=db)
 
@@ -65,7 +94,7 @@ def get_definition(db: Session, definition_id: int) -> DefinitionOut:
     try:
         definition = (
             db.query(Definition)
-            .options(joinedload(Definition.examples))
+            .options(selectinload(Definition.examples))
             .filter(Definition.id == definition_id)
             .first()
         )
@@ -89,44 +118,41 @@ def update_definition(
     definition_id: int,
     definition: DefinitionNested,
 ) -> DefinitionOut:
-    """Update a specific definition."""
+    """Update a specific definition.
+
+    Runs a fixed number of statements whatever the example count: UPDATE ...
+    RETURNING for the definition, one DELETE and one multi-row INSERT ...
+    RETURNING for its examples, and one parent timestamp update.
+    """
     try:
-        db_definition = (
-            db.query(Definition).filter(Definition.id == definition_id).first()
-        )
-        if not db_definition:
+        row = db.execute(
+            update(Definition)
+            .where(Definition.id == definition_id)
+            .values(
+                definition_text=definition.definition_text,
+                part_of_speech=definition.part_of_speech,
+                order=definition.order,
+            )
+            .returning(*DEFINITION_COLUMNS)
+        ).first()
+        if row is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Definition {definition_id} not found",
             )
 
-        # Update definition fields
-        db_definition.definition_text = definition.definition_text
-        db_definition.part_of_speech = definition.part_of_speech
-        db_definition.order = definition.order
-
         # Replace examples
-        _ = db.query(Example).filter(Example.definition_id == definition_id).delete()
-        for example_data in definition.examples:
-            db_example = Example(
-                definition_id=definition_id,
-                example_text=example_data.example_text,
-                source=example_data.source,
-            )
-            db.add(db_example)
+        _ = db.execute(delete(Example).where(Example.definition_id == definition_id))
+        example_rows = _insert_examples(db, definition_id, definition)
 
+        # Bulk statements bypass the ORM listeners that bump Word.updated_at
+        touch_word(row.word_id, db)
         db.commit()
 
-        # Load with examples
-        definition_with_examples = (
-            db.query(Definition)
-            .options(joinedload(Definition.examples))
-            .filter(Definition.id == definition_id)
-            .first()
+        return construct_row(
+            DefinitionOut, row, examples=construct_rows(ExampleOut, example_rows)
         )
 
-        return DefinitionOut.model_validate(definition_with_examples)
-
     except HTTPException:
         raise
     except Exception:
@@ -136,19 +162,51 @@ def update_definition(
 def delete_definition(db: Session, definition_id: int) -> None:
     """Delete a definition (cascades to examples)."""
     try:
-        db_definition = (
-            db.query(Definition).filter(Definition.id == definition_id).first()
+        word_id = db.scalar(
+            delete(Definition)
+            .where(Definition.id == definition_id)
+            .returning(Definition.word_id)
         )
-        if not db_definition:
+        if word_id is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Definition {definition_id} not found",
             )
 
-        db.delete(db_definition)
+        touch_word(word_id, db)
         db.commit()
 
     except HTTPException:
         raise
     except Exception:
         handle_db_error(f"delete definition {definition_id}", db=db)
+
+
+def _insert_examples(
+    db: Session, definition_id: int, definition: DefinitionNested
+) -> Sequence[Row[Any]]:
+    """Insert a definition's examples with one multi-row INSERT ... RETURNING.
+
+    Args:
+        db: Database session
+        definition_id: Definition the examples belong to
+        definition: Definition payload carrying the examples
+
+    Returns:
+        Inserted example rows in payload order
+    """
+    if not definition.examples:
+        return []
+    return db.execute(
+        insert(Example).returning(
+            *model_columns(Example, ExampleOut), sort_by_parameter_order=True
+        ),
+        [
+            {
+                "definition_id": definition_id,
+                "example_text": example_data.example_text,
+                "source": example_data.source,
+            }
+            for example_data in definition.examples
+        ],
+    ).all()
@@ -2,47 +2,71 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from fastapi import HTTPException
+from sqlalchemy import bindparam, delete, exists, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
-from api.utils import handle_db_error
-from db.models.dictionary import Definition, Example
+from api.utils import construct_row, handle_db_error, insert_where, model_columns
+from db.models.dictionary import Definition, Example, touch_word
 from schemas.dictionary import ExampleBase, ExampleOut
 
 if TYPE_CHECKING:
+    from sqlalchemy import ScalarSelect
     from sqlalchemy.orm import Session
 
+# Built once at import so get_example only binds the id
+_EXAMPLE_BY_ID: Final = select(*model_columns(Example, ExampleOut)).where(
+    Example.id == bindparam("example_id")
+)
+
 
 def create_example(
     db: Session,
     definition_id: int,
     example: ExampleBase,
 ) -> ExampleOut:
-    """Add an example to an existing definition."""
+    """Add an example to an existing definition.
+
+    The definition check runs inside the INSERT (``WHERE EXISTS``) instead of a
+    separate verification SELECT.
+    """
     try:
-        # Verify definition exists
-        definition = db.query(Definition).filter(Definition.id == definition_id).first()
-        if not definition:
+        row = db.execute(
+            insert_where(
+                insert(Example),
+                {
+                    "definition_id": definition_id,
+                    "example_text": example.example_text,
+                    "source": example.source,
+                },
+                exists().where(Definition.id == definition_id),
+            ).returning(*model_columns(Example, ExampleOut))
+        ).first()
+        if row is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Definition {definition_id} not found",
             )
 
-        # Create example
-        db_example = Example(
-            definition_id=definition_id,
-            example_text=example.example_text,
-            source=example.source,
-        )
-        db.add(db_example)
+        # Bulk statements bypass the ORM listeners that bump Word.updated_at
+        touch_word(_word_id_of(definition_id), db)
         db.commit()
-        db.refresh(db_example)
 
-        return ExampleOut.model_validate(db_example)
+        return construct_row(ExampleOut, row)
 
     except HTTPException:
         raise
+    except IntegrityError as e:
+        db.rollback()
+        # Definition deleted concurrently between the EXISTS check and the FK check
+        if not db.scalar(select(exists().where(Definition.id == definition_id))):
+            raise HTTPException(
+                status_code=404,
+                detail=f"Definition {definition_id} not found",
+            ) from e
+        handle_db_error("create example", db=db)
     except Exception:
         handle_db_error("create example", db=db)
 
@@ -50,15 +74,15 @@ def create_example(
 def get_example(db: Session, example_id: int) -> ExampleOut:
     """Get a specific example."""
     try:
-        example = db.query(Example).filter(Example.id == example_id).first()
+        row = db.execute(_EXAMPLE_BY_ID, {"example_id": example_id}).first()
 
-        if not example:
+        if row is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Example {example_id} not found",
             )
 
-        return ExampleOut.model_validate(example)
+        return construct_row(ExampleOut, row)
 
     except HTTPException:
         raise
@@ -71,23 +95,25 @@ def update_example(
     example_id: int,
     example: ExampleBase,
 ) -> ExampleOut:
-    """Update a specific example."""
+    """Update a specific example with a single UPDATE ... RETURNING."""
     try:
-        db_example = db.query(Example).filter(Example.id == example_id).first()
-        if not db_example:
+        row = db.execute(
+            update(Example)
+            .where(Example.id == example_id)
+            .values(example_text=example.example_text, source=example.source)
+            .returning(*model_columns(Example, ExampleOut))
+        ).first()
+        if row is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Example {example_id} not found",
             )
 
-        # Update fields
-        db_example.example_text = example.example_text
-        db_example.source = example.source
-
+        # Bulk statements bypass the ORM listeners that bump Word.updated_at
+        touch_word(_word_id_of(row.definition_id), db)
         db.commit()
-        db.refresh(db_example)
 
-        return ExampleOut.model_validate(db_example)
+        return construct_row(ExampleOut, row)
 
     except HTTPException:
         raise
@@ -98,17 +124,30 @@ def update_example(
 def delete_example(db: Session, example_id: int) -> None:
     """Delete a specific example."""
     try:
-        db_example = db.query(Example).filter(Example.id == example_id).first()
-        if not db_example:
+        definition_id = db.scalar(
+            delete(Example)
+            .where(Example.id == example_id)
+            .returning(Example.definition_id)
+        )
+        if definition_id is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Example {example_id} not found",
             )
 
-        db.delete(db_example)
+        touch_word(_word_id_of(definition_id), db)
         db.commit()
 
     except HTTPException:
         raise
     except Exception:
         handle_db_error(f"delete example {example_id}", db=db)
+
+
+def _word_id_of(definition_id: int) -> ScalarSelect[int]:
+    """Subquery for the word owning a definition, resolved inside the UPDATE."""
+    return (
+        select(Definition.word_id)
+        .where(Definition.id == definition_id)
+        .scalar_subquery()
+    )
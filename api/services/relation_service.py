@@ -5,8 +5,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
-
-from api.utils import build_paginated_response, handle_db_error
+from sqlalchemy import delete, exists, select
+from sqlalchemy.exc import IntegrityError
+
+from api.cache import cached, invalidate
+from api.utils import (
+    build_paginated_response,
+    construct_row,
+    construct_rows,
+    fetch_offset_page,
+    handle_db_error,
+    insert_or_ignore,
+    insert_where,
+    model_columns,
+)
 from db.models.dictionary import Word, WordRelation
 from schemas.dictionary import PaginatedRelations, RelationCreate, RelationOut
 
@@ -15,56 +27,48 @@ if TYPE_CHECKING:
 
 
 def create_relation(db: Session, relation: RelationCreate) -> RelationOut:
-    """Create a word relation (synonym, antonym, etc)."""
-    try:
-        # Verify both words exist
-        word1 = db.query(Word).filter(Word.id == relation.word_id_1).first()
-        word2 = db.query(Word).filter(Word.id == relation.word_id_2).first()
-
-        if not word1:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Word {relation.word_id_1} not found",
-            )
-        if not word2:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Word {relation.word_id_2} not found",
-            )
+    """Create a word relation (synonym, antonym, etc).
 
-        # Check if relation already exists
-        existing = (
-            db.query(WordRelation)
-            .filter(
-                WordRelation.word_id_1 == relation.word_id_1,
-                WordRelation.word_id_2 == relation.word_id_2,
-                WordRelation.relation_type == relation.relation_type,
-            )
-            .first()
-        )
-        if existing:
+    Word existence and pair uniqueness are both checked by the INSERT itself
+    (``WHERE EXISTS`` plus ``ON CONFLICT DO NOTHING``); the words are only looked
+    up when nothing was inserted, to report which check failed.
+    """
+    try:
+        row = db.execute(
+            insert_where(
+                insert_or_ignore(db, WordRelation, ["word_id_1", "word_id_2"]),
+                {
+                    "word_id_1": relation.word_id_1,
+                    "word_id_2": relation.word_id_2,
+                    "relation_type": relation.relation_type,
+                },
+                exists().where(Word.id == relation.word_id_1),
+                exists().where(Word.id == relation.word_id_2),
+            ).returning(*model_columns(WordRelation, RelationOut))
+        ).first()
+        if row is None:
+            _raise_missing_word(db, relation)
             raise HTTPException(
                 status_code=400,
                 detail="Word relation already exists",
             )
 
-        db_relation = WordRelation(
-            word_id_1=relation.word_id_1,
-            word_id_2=relation.word_id_2,
-            relation_type=relation.relation_type,
-        )
-        db.add(db_relation)
         db.commit()
-        db.refresh(db_relation)
-
-        return RelationOut.model_validate(db_relation)
+        invalidate("relations")
+        return construct_row(RelationOut, row)
 
     except HTTPException:
         raise
+    except IntegrityError as e:
+        # A word was deleted concurrently between the EXISTS and FK checks
+        db.rollback()
+        _raise_missing_word(db, relation, cause=e)
+        handle_db_error("create relation", db=db)
     except Exception:
         handle_db_error("create relation", db=db)
 
 
+@cached("relations:list", PaginatedRelations)
 def list_relations(
     db: Session,
     word_id: int | None,
@@ -74,7 +78,7 @@ def list_relations(
 ) -> PaginatedRelations:
     """List word relations with optional filters."""
     try:
-        query = db.query(WordRelation)
+        query = db.query(*model_columns(WordRelation, RelationOut))
 
         # Apply filters
         if word_id:
@@ -85,14 +89,17 @@ def list_relations(
         if relation_type:
             query = query.filter(WordRelation.relation_type == relation_type)
 
-        # Paginate
-        total = query.count()
+        # Paginate; page rows and the total come back from one query
         skip = (page - 1) * page_size
-        relations = query.offset(skip).limit(page_size).all()
+        relations, total = fetch_offset_page(
+            query.order_by(WordRelation.word_id_1, WordRelation.word_id_2),
+            skip,
+            page_size,
+        )
 
-        relation_outs = [RelationOut.model_validate(r) for r in relations]
-        return PaginatedRelations.model_validate(
-            build_paginated_response(relation_outs, total, page, page_size),
+        relation_outs = construct_rows(RelationOut, relations)
+        return build_paginated_response(
+            PaginatedRelations, relation_outs, total, page, page_size
         )
 
     except Exception:
@@ -107,23 +114,44 @@ def delete_relation(
 ) -> None:
     """Delete a word relation."""
     try:
-        db_relation = (
-            db.query(WordRelation)
-            .filter(
+        deleted = db.scalar(
+            delete(WordRelation)
+            .where(
                 WordRelation.word_id_1 == word_id_1,
                 WordRelation.word_id_2 == word_id_2,
                 WordRelation.relation_type == relation_type,
             )
-            .first()
+            .returning(WordRelation.word_id_1)
         )
-
-        if not db_relation:
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Word relation not found")
 
-        db.delete(db_relation)
         db.commit()
+        invalidate("relations")
 
     except HTTPException:
         raise
     except Exception:
         handle_db_error("delete relation", db=db)
+
+
+def _raise_missing_word(
+    db: Session, relation: RelationCreate, cause: Exception | None = None
+) -> None:
+    """Raise 404 for the first word of a relation that does not exist.
+
+    Args:
+        db: Database session
+        relation: Relation payload whose words are checked
+        cause: Exception to chain the 404 from
+
+    Raises:
+        HTTPException: If either word is missing
+    """
+    word_ids = (relation.word_id_1, relation.word_id_2)
+    found = set(db.scalars(select(Word.id).where(Word.id.in_(word_ids))))
+    for word_id in word_ids:
+        if word_id not in found:
+            raise HTTPException(
+                status_code=404, detail=f"Word {word_id} not found"
+            ) from cause
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
 from fastapi import HTTPException
-
-from api.utils import build_paginated_response, handle_db_error
+from sqlalchemy import bindparam, delete, select, update
+
+from api.cache import cached, invalidate, invalidate_on_commit
+from api.utils import (
+    build_paginated_response,
+    construct_row,
+    construct_rows,
+    fetch_offset_page,
+    handle_db_error,
+    ilike_prefix,
+    insert_or_ignore,
+    model_columns,
+)
 from db.models.dictionary import Tag
 from schemas.dictionary import PaginatedTags, TagCreate, TagOut, TagUpdate
 
 if TYPE_CHECKING:
+    from sqlalchemy import Row
     from sqlalchemy.orm import Session
 
+# Built once at import: hot reads skip statement construction, and the cached
+# compiled SQL is reused with only the bound id changing
+_TAG_BY_ID: Final = select(*model_columns(Tag, TagOut)).where(
+    Tag.id == bindparam("tag_id")
+)
+
 
 def get_or_create_tags(db: Session, tag_names: list[str]) -> list[int]:
     """Get or create tags by name, return list of tag IDs.
@@ -22,46 +40,80 @@ def get_or_create_tags(db: Session, tag_names: list[str]) -> list[int]:
         tag_names: List of tag names
 
     Returns:
-        List of tag IDs
+        List of tag IDs, in the order of ``tag_names``
+    """
+    return [row.id for row in get_or_create_tag_rows(db, tag_names)]
+
+
+def get_or_create_tag_rows(
+    db: Session, tag_names: list[str]
+) -> list[Row[*tuple[Any, ...]]]:
+    """Get or create tags by name, return their ``TagOut`` columns.
+
+    Runs at most three statements whatever the number of names: one SELECT for
+    existing tags, one multi-row ``INSERT ... ON CONFLICT DO NOTHING RETURNING``
+    for the missing ones, and a re-SELECT only for names another transaction
+    created between the two.
+
+    Args:
+        db: Database session
+        tag_names: List of tag names
+
+    Returns:
+        One row per name, in the order of ``tag_names``
     """
     if not tag_names:
         return []
 
-    tag_ids: list[int] = []
+    tag_by_name = _tags_by_name(db, tag_names)
 
-    for tag_name in tag_names:
-        # Try to find existing tag
-        existing_tag = db.query(Tag).filter(Tag.name == tag_name).first()
+    missing = [name for name in dict.fromkeys(tag_names) if name not in tag_by_name]
+    if missing:
+        created = db.execute(
+            insert_or_ignore(db, Tag, ["name"])
+            .values([{"name": name, "description": None} for name in missing])
+            .returning(*model_columns(Tag, TagOut))
+        ).all()
+        tag_by_name.update((row.name, row) for row in created)
+        # Callers own the commit; drop the cached lists once it lands
+        invalidate_on_commit(db, "tags:list")
 
-        if existing_tag:
-            tag_ids.append(existing_tag.id)
-        else:
-            # Create new tag
-            new_tag = Tag(name=tag_name, description=None)
-            db.add(new_tag)
-            db.flush()  # Get the ID without committing
-            tag_ids.append(new_tag.id)
+        # Names inserted concurrently were skipped by ON CONFLICT; read their rows
+        raced = [name for name in missing if name not in tag_by_name]
+        if raced:
+            tag_by_name.update(_tags_by_name(db, raced))
 
-    return tag_ids
+    return [tag_by_name[name] for name in tag_names]
+
+
+def _tags_by_name(
+    db: Session, tag_names: list[str]
+) -> dict[str, Row[*tuple[Any, ...]]]:
+    """Map existing tag names to their ``TagOut`` columns with one query."""
+    rows = db.execute(
+        select(*model_columns(Tag, TagOut)).where(Tag.name.in_(tag_names))
+    ).all()
+    return {row.name: row for row in rows}
 
 
 def create_tag(db: Session, tag: TagCreate) -> TagOut:
     """Create a new tag."""
     try:
-        # Check if tag already exists
-        existing = db.query(Tag).filter(Tag.name == tag.name).first()
-        if existing:
+        # Insert unless the name is taken (unique constraint), in one statement
+        row = db.execute(
+            insert_or_ignore(db, Tag, ["name"])
+            .values(name=tag.name, description=tag.description)
+            .returning(*model_columns(Tag, TagOut))
+        ).first()
+        if row is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Tag '{tag.name}' already exists",
             )
 
-        db_tag = Tag(name=tag.name, description=tag.description)
-        db.add(db_tag)
         db.commit()
-        db.refresh(db_tag)
-
-        return TagOut.model_validate(db_tag)
+        invalidate("tags")
+        return construct_row(TagOut, row)
 
     except HTTPException:
         raise
@@ -69,46 +121,72 @@ def create_tag(db: Session, tag: TagCreate) -> TagOut:
         handle_db_error("create tag", db=db)
 
 
+@cached("tags:list", PaginatedTags)
 def list_tags(
     db: Session,
     search: str | None,
     page: int,
     page_size: int,
+    after_id: int | None = None,
 ) -> PaginatedTags:
-    """List or search tags with pagination."""
+    """List or search tags with pagination.
+
+    With ``after_id`` set, pages are ordered by id and fetched by keyset
+    (``WHERE id > after_id``) instead of OFFSET.
+    """
     try:
-        query = db.query(Tag)
+        query = db.query(*model_columns(Tag, TagOut))
 
         # Apply search filter
         if search:
-            query = query.filter(Tag.name.ilike(f"{search}%"))
-
-        # Order by name
-        query = query.order_by(Tag.name.asc())
+            query = query.filter(ilike_prefix(Tag.name, search))
 
         # Paginate
-        total = query.count()
-        skip = (page - 1) * page_size
-        tags = query.offset(skip).limit(page_size).all()
+        has_more: bool | None = None
+        next_cursor: int | None = None
+        if after_id is not None:
+            total = query.count()
+            # Fetch one extra row to learn whether another page follows
+            tags = (
+                query.filter(Tag.id > after_id)
+                .order_by(Tag.id.asc())
+                .limit(page_size + 1)
+                .all()
+            )
+            has_more = len(tags) > page_size
+            tags = tags[:page_size]
+            next_cursor = tags[-1].id if has_more else None
+        else:
+            skip = (page - 1) * page_size
+            tags, total = fetch_offset_page(
+                query.order_by(Tag.name.asc()), skip, page_size
+            )
 
-        tag_outs = [TagOut.model_validate(t) for t in tags]
-        return PaginatedTags.model_validate(
-            build_paginated_response(tag_outs, total, page, page_size),
+        tag_outs = construct_rows(TagOut, tags)
+        return build_paginated_response(
+            PaginatedTags,
+            tag_outs,
+            total,
+            page,
+            page_size,
+            next_cursor=next_cursor,
+            has_more=has_more,
         )
 
     except Exception:
         handle_db_error("list tags")
 
 
+@cached("tags:get", TagOut)
 def get_tag(db: Session, tag_id: int) -> TagOut:
     """Get a specific tag."""
     try:
-        tag = db.query(Tag).filter(Tag.id == tag_id).first()
+        row = db.execute(_TAG_BY_ID, {"tag_id": tag_id}).first()
 
-        if not tag:
+        if row is None:
             raise HTTPException(status_code=404, detail=f"Tag {tag_id} not found")
 
-        return TagOut.model_validate(tag)
+        return construct_row(TagOut, row)
 
     except HTTPException:
         raise
@@ -117,22 +195,23 @@ def get_tag(db: Session, tag_id: int) -> TagOut:
 
 
 def update_tag(db: Session, tag_id: int, tag_update: TagUpdate) -> TagOut:
-    """Update a tag."""
+    """Update a tag with a single UPDATE ... RETURNING."""
     try:
-        db_tag = db.query(Tag).filter(Tag.id == tag_id).first()
-        if not db_tag:
+        fields = tag_update.model_dump(exclude_none=True)
+        columns = model_columns(Tag, TagOut)
+        if fields:
+            stmt = (
+                update(Tag).where(Tag.id == tag_id).values(**fields).returning(*columns)
+            )
+        else:
+            stmt = select(*columns).where(Tag.id == tag_id)
+        row = db.execute(stmt).first()
+        if row is None:
             raise HTTPException(status_code=404, detail=f"Tag {tag_id} not found")
 
-        # Update fields
-        if tag_update.name is not None:
-            db_tag.name = tag_update.name
-        if tag_update.description is not None:
-            db_tag.description = tag_update.description
-
         db.commit()
-        db.refresh(db_tag)
-
-        return TagOut.model_validate(db_tag)
+        invalidate("tags")
+        return construct_row(TagOut, row)
 
     except HTTPException:
         raise
@@ -143,12 +222,12 @@ def update_tag(db: Session, tag_id: int, tag_update: TagUpdate) -> TagOut:
 def delete_tag(db: Session, tag_id: int) -> None:
     """Delete a tag."""
     try:
-        db_tag = db.query(Tag).filter(Tag.id == tag_id).first()
-        if not db_tag:
+        deleted = db.scalar(delete(Tag).where(Tag.id == tag_id).returning(Tag.id))
+        if deleted is None:
             raise HTTPException(status_code=404, detail=f"Tag {tag_id} not found")
 
-        db.delete(db_tag)
         db.commit()
+        invalidate("tags")
 
     except HTTPException:
         raise
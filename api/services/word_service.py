@@ -5,22 +5,105 @@ Handles word CRUD including nested data (definitions, examples, tags).
 
 from __future__ import annotations
 
-from fastapi import HTTPException
-from sqlalchemy import tuple_
-from sqlalchemy.orm import Session, joinedload
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Final
 
-from api.services.tag_service import get_or_create_tags
-from api.utils import build_paginated_response, handle_db_error
-from db.models.dictionary import Definition, Example, Word, WordForm, WordTag
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    bindparam,
+    delete,
+    exists,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session, raiseload, selectinload
+
+from api.cache import invalidate
+from api.services.definition_service import DEFINITION_COLUMNS
+from api.services.tag_service import get_or_create_tag_rows, get_or_create_tags
+from api.utils import (
+    build_paginated_response,
+    construct_row,
+    construct_rows,
+    decode_text_cursor,
+    encode_text_cursor,
+    fetch_offset_page,
+    handle_db_error,
+    ilike_contains,
+    ilike_prefix,
+    insert_or_ignore,
+    model_columns,
+)
+from db.models.dictionary import (
+    Definition,
+    Example,
+    Word,
+    WordForm,
+    WordTag,
+    touch_word,
+)
 from schemas.dictionary import (
+    DefinitionNested,
+    DefinitionOut,
+    ExampleOut,
     PaginatedResponse,
     PaginatedWords,
+    TagOut,
     WordCreate,
+    WordFormOut,
     WordFull,
     WordOut,
     WordUpdate,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import ColumnElement, Insert, Row, Select
+    from sqlalchemy.sql.dml import ReturningInsert
+
+# Rows per multi-row INSERT when creating words in bulk
+BULK_INSERT_CHUNK_SIZE: Final = 1000
+
+# Shortest search text accepted; one character matches too much to be useful
+MIN_SEARCH_LENGTH: Final = 2
+
+# Eager loaders for every collection WordFull serialises. selectinload sends one
+# IN query per level instead of multiplying joined rows; raiseload turns any
+# other relationship access during serialisation into an error, not an N+1.
+_WORD_FULL_LOADERS: Final = (
+    selectinload(Word.definitions).selectinload(Definition.examples),
+    selectinload(Word.tags),
+    selectinload(Word.word_forms),
+    raiseload("*"),
+)
+
+# Whole-list validator built once, so ORM lists validate in a single core call
+_WORD_FULL_LIST: Final = TypeAdapter(list[WordFull])
+
+
+def _word_lookup(
+    *criteria: ColumnElement[bool],
+) -> tuple[Select[*tuple[Any, ...]], Select[Word]]:
+    """Build the (WordOut columns, WordFull entity) selects for one lookup."""
+    return (
+        select(*model_columns(Word, WordOut)).where(*criteria),
+        select(Word).options(*_WORD_FULL_LOADERS).where(*criteria),
+    )
+
+
+# Single-word lookups built once at import, so get_word and get_word_by_text
+# only bind parameters instead of rebuilding and re-keying each statement
+_WORD_BY_ID: Final = _word_lookup(Word.id == bindparam("word_id"))
+_WORD_BY_TEXT: Final = _word_lookup(
+    Word.word_text == bindparam("word_text"),
+    Word.language_code == bindparam("language_code"),
+)
+
 
 def create_words(
     db: Session,
@@ -43,24 +126,6 @@ def create_words(
 def _create_single_word(db: Session, word_data: WordCreate) -> WordOut | WordFull:
     """Create a single word with optional nested data."""
     try:
-        # Check if word already exists
-        existing = (
-            db.query(Word)
-            .filter(
-                Word.word_text == word_data.word_text,
-                Word.language_code == word_data.language_code,
-            )
-            .first()
-        )
-        if existing:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"Word '{word_data.word_text}' already exists "
-                    f"for language '{word_data.language_code}'"
-                ),
-            )
-
         # Check if nested creation
         has_nested_data = (
             word_data.definitions or word_data.tags or word_data.word_forms
@@ -70,14 +135,9 @@ def _create_single_word(db: Session, word_data: WordCreate) -> WordOut | WordFul
             return _create_word_with_nested_data(db, word_data)
 
         # Simple word creation
-        db_word = Word(
-            word_text=word_data.word_text,
-            language_code=word_data.language_code,
-        )
-        db.add(db_word)
+        row = _insert_word(db, word_data)
         db.commit()
-        db.refresh(db_word)
-        return WordOut.model_validate(db_word)
+        return construct_row(WordOut, row)
 
     except HTTPException:
         raise
@@ -85,68 +145,45 @@ def _create_single_word(db: Session, word_data: WordCreate) -> WordOut | WordFul
         handle_db_error("create word", db=db)
 
 
+def _insert_word(db: Session, word_data: WordCreate) -> Row[Any]:
+    """Insert a word row, rejecting an existing (word_text, language_code) pair.
+
+    A single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` replaces the
+    SELECT-then-INSERT existence check, so concurrent creates cannot both pass.
+
+    Raises:
+        HTTPException: 400 if the word already exists for the language
+    """
+    row = db.execute(
+        insert_or_ignore(db, Word, ["word_text", "language_code"])
+        .values(word_text=word_data.word_text, language_code=word_data.language_code)
+        .returning(*model_columns(Word, WordOut))
+    ).first()
+    if row is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Word '{word_data.word_text}' already exists "
+                f"for language '{word_data.language_code}'"
+            ),
+        )
+    return row
+
+
 def _create_word_with_nested_data(db: Session, word_data: WordCreate) -> WordFull:
-    """Create a word with all nested data (definitions, examples, tags)."""
-    try:
-        # Get or create tags by name
-        tag_ids = get_or_create_tags(db, word_data.tags)
+    """Create a word with all nested data (definitions, examples, tags).
 
+    Every insert returns the columns the response needs, so the result is
+    built from those rows instead of re-selecting the word after commit.
+    """
+    try:
         # Create word
-        db_word = Word(
-            word_text=word_data.word_text,
-            language_code=word_data.language_code,
-        )
-        db.add(db_word)
-        db.flush()
-
-        # Create definitions and examples
-        for def_data in word_data.definitions:
-            db_definition = Definition(
-                word_id=db_word.id,
-                definition_text=def_data.definition_text,
-                part_of_speech=def_data.part_of_speech,
-                order=def_data.order,
-            )
-            db.add(db_definition)
-            db.flush()
-
-            # Create examples
-            for example_data in def_data.examples:
-                db_example = Example(
-                    definition_id=db_definition.id,
-                    example_text=example_data.example_text,
-                    source=example_data.source,
-                )
-                db.add(db_example)
-
-        # Associate tags
-        for tag_id in tag_ids:
-            db_word_tag = WordTag(word_id=db_word.id, tag_id=tag_id)
-            db.add(db_word_tag)
-
-        # Create word forms (inflections)
-        for form_data in word_data.word_forms:
-            db_word_form = WordForm(
-                word_id=db_word.id,
-                form_text=form_data.form_text,
-                form_type=form_data.form_type,
-            )
-            db.add(db_word_form)
+        word_row = _insert_word(db, word_data)
 
+        (word_full,) = _insert_nested_data(db, [word_row], [word_data])
         db.commit()
-
-        # Fetch complete word with nested data
-        word = (
-            db.query(Word)
-            .options(
-                joinedload(Word.definitions).joinedload(Definition.examples),
-                joinedload(Word.tags),
-                joinedload(Word.word_forms),
-            )
-            .filter(Word.id == db_word.id)
-            .first()
-        )
-        return WordFull.model_validate(word)
+        return word_full
 
     except HTTPException:
         raise
@@ -157,7 +194,11 @@ def _create_word_with_nested_data(db: Session, word_data: WordCreate) -> WordFul
 def _create_words_bulk(
     db: Session, words: list[WordCreate]
 ) -> list[WordOut] | list[WordFull]:
-    """Create multiple words in a single transaction."""
+    """Create multiple words in a single transaction.
+
+    Rows are written with one multi-row INSERT per table and chunk, rather than
+    one INSERT per word, definition, example, tag link and form.
+    """
     try:
         if not words:
             raise HTTPException(status_code=400, detail="No words provided")
@@ -170,37 +211,40 @@ def _create_words_bulk(
                 detail="Duplicate words found in request",
             )
 
-        # Check if any words already exist
-        existing_words = (
-            db.query(Word.word_text, Word.language_code)
-            .filter(tuple_(Word.word_text, Word.language_code).in_(word_keys))
-            .all()
+        # ON CONFLICT DO NOTHING on uq_word_language replaces a SELECT of the
+        # existing keys: words missing from RETURNING were already stored
+        inserted = _bulk_insert_rows(
+            db,
+            insert_or_ignore(db, Word, ["word_text", "language_code"]).returning(
+                *model_columns(Word, WordOut)
+            ),
+            [
+                {"word_text": w.word_text, "language_code": w.language_code}
+                for w in words
+            ],
         )
-        if existing_words:
-            duplicates = [f"{text} ({lang})" for text, lang in existing_words]
+        row_by_key = {(row.word_text, row.language_code): row for row in inserted}
+        duplicates = [
+            f"{text} ({lang})"
+            for text, lang in word_keys
+            if (text, lang) not in row_by_key
+        ]
+        if duplicates:
+            db.rollback()
             raise HTTPException(
                 status_code=400,
                 detail=f"Words already exist: {', '.join(duplicates)}",
             )
+        word_rows = [row_by_key[key] for key in word_keys]
 
-        # Check if any have nested data
-        has_nested = any(w.definitions or w.tags or w.word_forms for w in words)
-
-        if has_nested:
-            # Create one by one to handle nested data
-            return [_create_word_with_nested_data(db, w) for w in words]
+        # Flat words are fully described by the INSERT ... RETURNING rows
+        if not any(w.definitions or w.tags or w.word_forms for w in words):
+            db.commit()
+            return construct_rows(WordOut, word_rows)
 
-        # Simple bulk creation
-        db_words = [
-            Word(word_text=w.word_text, language_code=w.language_code) for w in words
-        ]
-        db.add_all(db_words)
+        word_fulls = _insert_nested_data(db, word_rows, words)
         db.commit()
-
-        for db_word in db_words:
-            db.refresh(db_word)
-
-        return [WordOut.model_validate(w) for w in db_words]
+        return word_fulls
 
     except HTTPException:
         raise
@@ -208,6 +252,184 @@ def _create_words_bulk(
         handle_db_error("create words in bulk", db=db)
 
 
+def _insert_nested_data(
+    db: Session, word_rows: Sequence[Row[Any]], words: Sequence[WordCreate]
+) -> list[WordFull]:
+    """Insert the definitions, examples, tags and forms of newly inserted words.
+
+    Each table gets one multi-row INSERT (per chunk) for the whole batch, and
+    each returns the columns its response schema needs, so the WordFull
+    responses are assembled from those rows without re-selecting anything.
+
+    Args:
+        db: Database session
+        word_rows: Inserted word rows (``WordOut`` columns), one per payload
+        words: Word payloads carrying the nested data
+
+    Returns:
+        One WordFull per word, in input order
+    """
+    words_with_ids = [(row.id, w) for row, w in zip(word_rows, words, strict=True)]
+
+    # Resolve every tag once for the whole batch
+    tag_names = list(dict.fromkeys(name for w in words for name in w.tags))
+    tag_by_name = dict(
+        zip(tag_names, get_or_create_tag_rows(db, tag_names), strict=True)
+    )
+    word_tags = [
+        (word_id, tag_by_name[name])
+        for word_id, w in words_with_ids
+        for name in dict.fromkeys(w.tags)
+    ]
+
+    definitions = [
+        (word_id, def_data)
+        for word_id, w in words_with_ids
+        for def_data in w.definitions
+    ]
+    definition_rows = _bulk_insert_rows(
+        db,
+        insert(Definition).returning(*DEFINITION_COLUMNS, sort_by_parameter_order=True),
+        [_definition_row(word_id, def_data) for word_id, def_data in definitions],
+    )
+    example_rows = _bulk_insert_rows(
+        db,
+        insert(Example).returning(
+            *model_columns(Example, ExampleOut), sort_by_parameter_order=True
+        ),
+        _example_rows(
+            zip(
+                (row.id for row in definition_rows),
+                (def_data for _, def_data in definitions),
+                strict=True,
+            )
+        ),
+    )
+    _bulk_insert(
+        db,
+        insert(WordTag),
+        [{"word_id": word_id, "tag_id": tag.id} for word_id, tag in word_tags],
+    )
+    form_rows = _bulk_insert_rows(
+        db,
+        insert(WordForm).returning(
+            *model_columns(WordForm, WordFormOut), sort_by_parameter_order=True
+        ),
+        [
+            {
+                "word_id": word_id,
+                "form_text": form_data.form_text,
+                "form_type": form_data.form_type,
+            }
+            for word_id, w in words_with_ids
+            for form_data in w.word_forms
+        ],
+    )
+
+    # Group the returned rows under their parents
+    examples: defaultdict[int, list[ExampleOut]] = defaultdict(list)
+    for example in construct_rows(ExampleOut, example_rows):
+        examples[example.definition_id].append(example)
+    word_definitions: defaultdict[int, list[DefinitionOut]] = defaultdict(list)
+    for row in definition_rows:
+        word_definitions[row.word_id].append(
+            construct_row(DefinitionOut, row, examples=examples[row.id])
+        )
+    tags: defaultdict[int, list[TagOut]] = defaultdict(list)
+    for word_id, tag in word_tags:
+        tags[word_id].append(construct_row(TagOut, tag))
+    forms: defaultdict[int, list[WordFormOut]] = defaultdict(list)
+    for form in construct_rows(WordFormOut, form_rows):
+        forms[form.word_id].append(form)
+
+    return [
+        construct_row(
+            WordFull,
+            row,
+            definitions=word_definitions[row.id],
+            tags=tags[row.id],
+            word_forms=forms[row.id],
+        )
+        for row in word_rows
+    ]
+
+
+def _bulk_insert_ids(
+    db: Session, stmt: ReturningInsert[int], rows: list[dict[str, Any]]
+) -> list[int]:
+    """Execute an ``INSERT ... RETURNING id`` in chunks.
+
+    Args:
+        db: Database session
+        stmt: Insert statement returning the primary key in parameter order
+        rows: Column values, one dict per row
+
+    Returns:
+        Inserted IDs in the same order as ``rows``
+    """
+    ids: list[int] = []
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        ids.extend(db.scalars(stmt, rows[start : start + BULK_INSERT_CHUNK_SIZE]))
+    return ids
+
+
+def _bulk_insert_rows[*Ts](
+    db: Session, stmt: ReturningInsert[*Ts], rows: list[dict[str, Any]]
+) -> list[Row[*Ts]]:
+    """Execute an ``INSERT ... RETURNING`` in chunks.
+
+    Args:
+        db: Database session
+        stmt: Insert statement with ``RETURNING``
+        rows: Column values, one dict per row
+
+    Returns:
+        Returned rows, in the order of ``rows`` when ``stmt`` sorts by parameter
+        order
+    """
+    returned: list[Row[*Ts]] = []
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        returned.extend(db.execute(stmt, rows[start : start + BULK_INSERT_CHUNK_SIZE]))
+    return returned
+
+
+def _bulk_insert(db: Session, stmt: Insert, rows: list[dict[str, Any]]) -> None:
+    """Execute an ``INSERT`` in chunks.
+
+    Args:
+        db: Database session
+        stmt: Insert statement
+        rows: Column values, one dict per row
+    """
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        db.execute(stmt, rows[start : start + BULK_INSERT_CHUNK_SIZE])
+
+
+def _definition_row(word_id: int, def_data: DefinitionNested) -> dict[str, Any]:
+    """Column values for inserting a definition of ``word_id``."""
+    return {
+        "word_id": word_id,
+        "definition_text": def_data.definition_text,
+        "part_of_speech": def_data.part_of_speech,
+        "order": def_data.order,
+    }
+
+
+def _example_rows(
+    definitions: Iterable[tuple[int, DefinitionNested]],
+) -> list[dict[str, Any]]:
+    """Column values for inserting the examples of each (definition ID, payload) pair."""
+    return [
+        {
+            "definition_id": definition_id,
+            "example_text": example_data.example_text,
+            "source": example_data.source,
+        }
+        for definition_id, def_data in definitions
+        for example_data in def_data.examples
+    ]
+
+
 def list_words(
     db: Session,
     search: str | None,
@@ -217,60 +439,145 @@ def list_words(
     include_all: bool,
     include_definitions: bool,
     include_tags: bool,
+    after_id: int | None = None,
+    cursor: str | None = None,
+    contains: bool = False,
 ) -> PaginatedWords | PaginatedResponse[WordFull]:
     """List or search words with pagination (returns basic fields by default).
 
     Search includes word forms (inflections) - searching "defying" finds "defy".
+    It matches a prefix by default, or anywhere in the text with ``contains``.
+    With ``after_id`` set, pages are ordered by id and fetched by keyset
+    (``WHERE id > after_id``) instead of OFFSET, so deep pages cost the same as
+    the first one. ``cursor`` (a previous ``next_page_cursor``) does the same in
+    alphabetical order, seeking past ``(word_text, id)`` and skipping the count.
+
+    Raises:
+        HTTPException: 400 if the search text is too short, the cursor is
+            malformed, or both ``cursor`` and ``after_id`` are given
     """
     try:
+        # The two cursors page in different orders and cannot be combined
+        if cursor is not None and after_id is not None:
+            raise HTTPException(
+                status_code=400, detail="Pass either cursor or after_id, not both"
+            )
+
         query = db.query(Word)
 
         # Apply filters
+        search = search.strip() if search else None
         if search:
+            if len(search) < MIN_SEARCH_LENGTH:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Search must be at least {MIN_SEARCH_LENGTH} characters",
+                )
             # Search by word text OR word forms (Oxford approach)
             # Searching "defying" should find the word "defy"
-            from sqlalchemy import or_
 
-            query = query.outerjoin(WordForm).filter(
+            matches = ilike_contains if contains else ilike_prefix
+            # EXISTS rather than a join, so a word matching several forms stays
+            # one row and the query needs no DISTINCT
+            query = query.filter(
                 or_(
-                    Word.word_text.ilike(f"{search}%"),
-                    WordForm.form_text.ilike(f"{search}%"),
+                    matches(Word.word_text, search),
+                    exists().where(
+                        WordForm.word_id == Word.id,
+                        matches(WordForm.form_text, search),
+                    ),
                 )
             )
         if language:
             query = query.filter(Word.language_code == language)
 
-        # Load nested data if requested
-        if include_all or include_definitions:
-            query = query.options(
-                joinedload(Word.definitions).joinedload(Definition.examples),
-            )
-        if include_all or include_tags:
-            query = query.options(joinedload(Word.tags))
-
-        # Always load word_forms to avoid N+1 queries
-        query = query.options(joinedload(Word.word_forms))
-
-        # Order by word text and remove duplicates from outer join
-        query = query.distinct().order_by(Word.word_text.asc())
+        # Load nested data if requested - every collection WordFull serialises is
+        # loaded with one IN query per level for the whole page (no lazy loads)
+        nested = include_all or include_definitions or include_tags
+        if nested:
+            query = query.options(*_WORD_FULL_LOADERS)
+        else:
+            # Plain rows: WordOut is built without ORM objects or validation
+            query = query.with_entities(*model_columns(Word, WordOut))
 
         # Paginate
-        total = query.count()
-        skip = (page - 1) * page_size
-        words = query.offset(skip).limit(page_size).all()
+        total: int | None = None
+        has_more: bool | None = None
+        next_cursor: int | None = None
+        next_page_cursor: str | None = None
+        # Word entities when nested, otherwise WordOut column rows
+        words: list[Any]
+        alphabetical = (Word.word_text.asc(), Word.id.asc())
+        if cursor is not None:
+            try:
+                after_text, cursor_id = decode_text_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+            # Fetch one extra row to learn whether another page follows
+            words = (
+                query.filter(
+                    tuple_(Word.word_text, Word.id) > tuple_(after_text, cursor_id)
+                )
+                .order_by(*alphabetical)
+                .limit(page_size + 1)
+                .all()
+            )
+            has_more = len(words) > page_size
+            words = words[:page_size]
+        elif after_id is not None:
+            total = query.count()
+            # Fetch one extra row to learn whether another page follows
+            words = (
+                query.filter(Word.id > after_id)
+                .order_by(Word.id.asc())
+                .limit(page_size + 1)
+                .all()
+            )
+            has_more = len(words) > page_size
+            words = words[:page_size]
+            next_cursor = words[-1].id if has_more else None
+        else:
+            # Page rows and the total come back from one query
+            skip = (page - 1) * page_size
+            rows, total = fetch_offset_page(
+                query.order_by(*alphabetical), skip, page_size
+            )
+            # Nested rows pair each Word with the window count; keep the Word
+            words = [row[0] for row in rows] if nested else rows
+            has_more = skip + len(words) < total
+
+        # Any alphabetical page can hand off to the cursor for the next one
+        if after_id is None and has_more:
+            next_page_cursor = encode_text_cursor(words[-1].word_text, words[-1].id)
 
         # Return WordFull if any nested data requested, otherwise WordOut
-        if include_all or include_definitions or include_tags:
-            word_fulls = [WordFull.model_validate(w) for w in words]
-            return PaginatedResponse[WordFull].model_validate(
-                build_paginated_response(word_fulls, total, page, page_size),
+        if nested:
+            word_fulls = _WORD_FULL_LIST.validate_python(words, from_attributes=True)
+            return build_paginated_response(
+                PaginatedResponse[WordFull],
+                word_fulls,
+                total,
+                page,
+                page_size,
+                next_cursor=next_cursor,
+                next_page_cursor=next_page_cursor,
+                has_more=has_more,
             )
 
-        word_outs = [WordOut.model_validate(w) for w in words]
-        return PaginatedWords.model_validate(
-            build_paginated_response(word_outs, total, page, page_size),
+        word_outs = construct_rows(WordOut, words)
+        return build_paginated_response(
+            PaginatedWords,
+            word_outs,
+            total,
+            page,
+            page_size,
+            next_cursor=next_cursor,
+            next_page_cursor=next_page_cursor,
+            has_more=has_more,
         )
 
+    except HTTPException:
+        raise
     except Exception:
         handle_db_error("list words")
 
@@ -284,27 +591,17 @@ def get_word(
 ) -> WordOut | WordFull:
     """Get a specific word (returns basic fields by default)."""
     try:
-        query = db.query(Word)
-
-        # Load requested nested data
-        if include_all or include_definitions:
-            query = query.options(
-                joinedload(Word.definitions).joinedload(Definition.examples),
-            )
-
-        if include_all or include_tags:
-            query = query.options(joinedload(Word.tags))
-
-        word = query.filter(Word.id == word_id).first()
+        word = _fetch_word(
+            db,
+            include_all or include_definitions or include_tags,
+            _WORD_BY_ID,
+            {"word_id": word_id},
+        )
 
-        if not word:
+        if word is None:
             raise HTTPException(status_code=404, detail=f"Word {word_id} not found")
 
-        # Return WordFull if any nested data requested, otherwise WordOut
-        if include_all or include_definitions or include_tags:
-            return WordFull.model_validate(word)
-
-        return WordOut.model_validate(word)
+        return word
 
     except HTTPException:
         raise
@@ -322,33 +619,20 @@ def get_word_by_text(
 ) -> WordOut | WordFull:
     """Get a specific word by text and language (returns basic fields by default)."""
     try:
-        query = db.query(Word)
-
-        # Load requested nested data
-        if include_all or include_definitions:
-            query = query.options(
-                joinedload(Word.definitions).joinedload(Definition.examples),
-            )
-
-        if include_all or include_tags:
-            query = query.options(joinedload(Word.tags))
-
-        word = query.filter(
-            Word.word_text == word_text,
-            Word.language_code == language_code,
-        ).first()
+        word = _fetch_word(
+            db,
+            include_all or include_definitions or include_tags,
+            _WORD_BY_TEXT,
+            {"word_text": word_text, "language_code": language_code},
+        )
 
-        if not word:
+        if word is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Word '{word_text}' not found for language '{language_code}'",
             )
 
-        # Return WordFull if any nested data requested, otherwise WordOut
-        if include_all or include_definitions or include_tags:
-            return WordFull.model_validate(word)
-
-        return WordOut.model_validate(word)
+        return word
 
     except HTTPException:
         raise
@@ -356,6 +640,35 @@ def get_word_by_text(
         handle_db_error(f"get word '{word_text}' for language '{language_code}'")
 
 
+def _fetch_word(
+    db: Session,
+    nested: bool,
+    lookup: tuple[Select[Any], Select[Any]],
+    params: dict[str, Any],
+) -> WordOut | WordFull | None:
+    """Fetch one word as WordFull when nested data is requested, else WordOut.
+
+    The flat case selects only WordOut's columns, so no ORM instance is built.
+
+    Args:
+        db: Database session
+        nested: Whether to load definitions, tags and word forms
+        lookup: Prebuilt (flat, nested) selects from ``_word_lookup``
+        params: Values for the lookup's bound parameters
+
+    Returns:
+        The word, or None if no row matches
+    """
+    flat_stmt, nested_stmt = lookup
+    if nested:
+        # Load nested data up front; WordFull serialises every collection
+        word = db.scalars(nested_stmt, params).first()
+        return None if word is None else WordFull.model_validate(word)
+
+    row = db.execute(flat_stmt, params).first()
+    return None if row is None else construct_row(WordOut, row)
+
+
 def update_word(
     db: Session,
     word_id: int,
@@ -367,26 +680,46 @@ def update_word(
     word fields or nested data (definitions, examples, tags) change.
     """
     try:
-        db_word = db.query(Word).filter(Word.id == word_id).first()
-        if not db_word:
-            raise HTTPException(status_code=404, detail=f"Word {word_id} not found")
-
-        # Update word fields
-        if word_update.word_text is not None:
-            db_word.word_text = word_update.word_text
-        if word_update.language_code is not None:
-            db_word.language_code = word_update.language_code
-
         # Check if nested update
         has_nested = word_update.definitions is not None or word_update.tags is not None
 
+        fields = word_update.model_dump(
+            include={"word_text", "language_code"}, exclude_none=True
+        )
+
         if has_nested:
+            # Update word fields (or just check the word exists) by primary key only
+            if fields:
+                stmt = (
+                    update(Word)
+                    .where(Word.id == word_id)
+                    .values(**fields)
+                    .returning(Word.id)
+                )
+            else:
+                stmt = select(Word.id).where(Word.id == word_id)
+            if db.scalar(stmt) is None:
+                raise HTTPException(status_code=404, detail=f"Word {word_id} not found")
+
             return _update_word_with_nested_data(db, word_id, word_update)
 
-        # Simple update
+        # Simple update - one UPDATE ... RETURNING instead of SELECT, UPDATE, refresh
+        columns = model_columns(Word, WordOut)
+        if fields:
+            stmt = (
+                update(Word)
+                .where(Word.id == word_id)
+                .values(**fields)
+                .returning(*columns)
+            )
+        else:
+            stmt = select(*columns).where(Word.id == word_id)
+        row = db.execute(stmt).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail=f"Word {word_id} not found")
+
         db.commit()
-        db.refresh(db_word)
-        return WordOut.model_validate(db_word)
+        return construct_row(WordOut, row)
 
     except HTTPException:
         raise
@@ -403,79 +736,82 @@ def _update_word_with_nested_data(
     try:
         # Update definitions
         if word_update.definitions is not None:
+            updated: list[tuple[int, DefinitionNested]] = []
+            new_definitions: list[DefinitionNested] = []
             for def_data in word_update.definitions:
-                if def_data.id:
-                    # Update existing definition
-                    db_def = (
-                        db.query(Definition)
-                        .filter(
-                            Definition.id == def_data.id,
-                            Definition.word_id == word_id,
-                        )
-                        .first()
-                    )
-                    if not db_def:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Definition {def_data.id} not found for word {word_id}",
-                        )
-
-                    db_def.definition_text = def_data.definition_text
-                    db_def.part_of_speech = def_data.part_of_speech
-                    db_def.order = def_data.order
-
-                    # Replace examples
-                    _ = (
-                        db.query(Example)
-                        .filter(Example.definition_id == db_def.id)
-                        .delete()
+                if not def_data.id:
+                    new_definitions.append(def_data)
+                    continue
+
+                # Update existing definition; RETURNING doubles as the ownership check
+                def_id = db.scalar(
+                    update(Definition)
+                    .where(
+                        Definition.id == def_data.id,
+                        Definition.word_id == word_id,
                     )
-                    for example_data in def_data.examples:
-                        db_example = Example(
-                            definition_id=db_def.id,
-                            example_text=example_data.example_text,
-                            source=example_data.source,
-                        )
-                        db.add(db_example)
-                else:
-                    # Create new definition
-                    db_def = Definition(
-                        word_id=word_id,
+                    .values(
                         definition_text=def_data.definition_text,
                         part_of_speech=def_data.part_of_speech,
                         order=def_data.order,
                     )
-                    db.add(db_def)
-                    db.flush()
+                    .returning(Definition.id)
+                )
+                if def_id is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Definition {def_data.id} not found for word {word_id}",
+                    )
+                updated.append((def_id, def_data))
 
-                    for example_data in def_data.examples:
-                        db_example = Example(
-                            definition_id=db_def.id,
-                            example_text=example_data.example_text,
-                            source=example_data.source,
-                        )
-                        db.add(db_example)
+            # Replace examples of every updated definition with one DELETE
+            if updated:
+                _ = db.execute(
+                    delete(Example).where(
+                        Example.definition_id.in_([def_id for def_id, _ in updated])
+                    )
+                )
+
+            # Create new definitions, then all examples, with one INSERT each
+            new_ids = _bulk_insert_ids(
+                db,
+                insert(Definition).returning(
+                    Definition.id, sort_by_parameter_order=True
+                ),
+                [_definition_row(word_id, def_data) for def_data in new_definitions],
+            )
+            _bulk_insert(
+                db,
+                insert(Example),
+                _example_rows([*updated, *zip(new_ids, new_definitions, strict=True)]),
+            )
 
         # Update tags
         if word_update.tags is not None:
             # Get or create tags by name
-            tag_ids = get_or_create_tags(db, word_update.tags)
+            tag_ids = list(dict.fromkeys(get_or_create_tags(db, word_update.tags)))
 
-            # Replace all tags
-            _ = db.query(WordTag).filter(WordTag.word_id == word_id).delete()
-            for tag_id in tag_ids:
-                db_word_tag = WordTag(word_id=word_id, tag_id=tag_id)
-                db.add(db_word_tag)
+            # Unlink only dropped tags and link only new ones, so links the
+            # update keeps are neither deleted nor rewritten
+            _ = db.execute(
+                delete(WordTag).where(
+                    WordTag.word_id == word_id, WordTag.tag_id.not_in(tag_ids)
+                )
+            )
+            _bulk_insert(
+                db,
+                insert_or_ignore(db, WordTag, ["word_id", "tag_id"]),
+                [{"word_id": word_id, "tag_id": tag_id} for tag_id in tag_ids],
+            )
 
+        # Bulk statements above bypass the ORM listeners that bump Word.updated_at
+        touch_word(word_id, db)
         db.commit()
 
         # Fetch complete word
         word = (
             db.query(Word)
-            .options(
-                joinedload(Word.definitions).joinedload(Definition.examples),
-                joinedload(Word.tags),
-            )
+            .options(*_WORD_FULL_LOADERS)
             .filter(Word.id == word_id)
             .first()
         )
@@ -490,12 +826,14 @@ def _update_word_with_nested_data(
 def delete_word(db: Session, word_id: int) -> None:
     """Delete a word (cascades to definitions, examples)."""
     try:
-        db_word = db.query(Word).filter(Word.id == word_id).first()
-        if not db_word:
+        # Children are removed by the ON DELETE CASCADE foreign keys
+        deleted = db.scalar(delete(Word).where(Word.id == word_id).returning(Word.id))
+        if deleted is None:
             raise HTTPException(status_code=404, detail=f"Word {word_id} not found")
 
-        db.delete(db_word)
         db.commit()
+        # Relations cascade with the word
+        invalidate("relations")
 
     except HTTPException:
         raise
@@ -1,7 +1,34 @@
 """API utilities."""
 
 from api.utils.error_handling import handle_db_error
+from api.utils.guarded_insert import insert_where
 from api.utils.logger import get_logger, logger
-from api.utils.pagination import build_paginated_response
+from api.utils.on_conflict import insert_or_ignore
+from api.utils.pagination import (
+    build_paginated_response,
+    decode_text_cursor,
+    encode_text_cursor,
+    fetch_offset_page,
+)
+from api.utils.request_body import json_body, json_body_openapi
+from api.utils.rows import construct_row, construct_rows, model_columns
+from api.utils.search import ilike_contains, ilike_prefix
 
-__all__ = ["build_paginated_response", "get_logger", "handle_db_error", "logger"]
+__all__ = [
+    "build_paginated_response",
+    "construct_row",
+    "construct_rows",
+    "decode_text_cursor",
+    "encode_text_cursor",
+    "fetch_offset_page",
+    "get_logger",
+    "handle_db_error",
+    "ilike_contains",
+    "ilike_prefix",
+    "insert_or_ignore",
+    "insert_where",
+    "json_body",
+    "json_body_openapi",
+    "logger",
+    "model_columns",
+]
@@ -18,6 +18,9 @@ def handle_db_error(
 ) -> NoReturn:
     """Handle database errors with logging and rollback.
 
+    Server errors are logged with their traceback; client errors (4xx) are
+    logged as a one-line warning.
+
     Args:
         operation: Description of the operation that failed (e.g., "create word")
         status_code: HTTP status code to return (default: 500)
@@ -29,7 +32,11 @@ def handle_db_error(
     if db is not None:
         db.rollback()
 
-    logger.exception("Failed to %s", operation)
+    if status_code >= 500:
+        logger.exception("Failed to %s", operation)
+    else:
+        # Client errors are expected; skip the traceback capture and formatting
+        logger.warning("Failed to %s", operation)
     raise HTTPException(
         status_code=status_code,
         detail=f"Failed to {operation}",
@@ -0,0 +1,41 @@
+"""Single-statement ``INSERT ... SELECT ... WHERE`` for parent-checked inserts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import cast, literal, select
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement, Insert
+
+
+def insert_where[InsertT: Insert](
+    stmt: InsertT, values: dict[str, Any], *conditions: ColumnElement[bool]
+) -> InsertT:
+    """Turn an insert into one that only writes the row when every condition holds.
+
+    Compiles to ``INSERT INTO t (...) SELECT :v1, :v2 ... WHERE <conditions>``,
+    so a parent-existence check such as ``exists().where(Word.id == word_id)``
+    runs inside the insert itself. Combined with ``RETURNING``, an empty result
+    means a condition failed, which saves the verification SELECT round-trip
+    and does not depend on the database enforcing foreign keys (SQLite in tests).
+
+    Args:
+        stmt: Insert to populate, e.g. ``insert(Model)`` or ``insert_or_ignore(...)``
+        values: Column values for the new row, keyed by column name
+        *conditions: Boolean expressions that must all be true for the insert
+
+    Returns:
+        The insert, selecting the values under the given conditions
+    """
+    columns = stmt.table.c
+    # Explicit casts: a bare bind in a SELECT list has no column to infer its type
+    # from, so PostgreSQL would otherwise read NULLs and untyped strings as text
+    row = select(
+        *(
+            cast(literal(value, columns[key].type), columns[key].type)
+            for key, value in values.items()
+        )
+    )
+    return stmt.from_select(list(values), row.where(*conditions))
@@ -0,0 +1,44 @@
+"""Dialect-aware ``INSERT ... ON CONFLICT DO NOTHING``."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+# Dialects with native ON CONFLICT support (Neon in production, SQLite in tests)
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_or_ignore(
+    db: Session, entity: type[Any], conflict_columns: list[str]
+) -> postgresql.Insert | sqlite.Insert:
+    """Build an insert that skips rows conflicting on a unique key.
+
+    Combined with ``RETURNING``, an empty result means the row already existed,
+    so uniqueness is checked by the database in the same statement instead of
+    a separate SELECT that concurrent writers could race past.
+
+    Args:
+        db: Database session (its bind selects the dialect)
+        entity: ORM model class to insert into
+        conflict_columns: Columns of the unique constraint or primary key
+
+    Returns:
+        Insert statement with ``ON CONFLICT (...) DO NOTHING``
+
+    Raises:
+        NotImplementedError: If the database dialect has no ON CONFLICT support
+    """
+    dialect = db.get_bind().dialect.name
+    insert = _DIALECT_INSERTS.get(dialect)
+    if insert is None:
+        msg = f"ON CONFLICT is not supported for dialect '{dialect}'"
+        raise NotImplementedError(msg)
+    return insert(entity).on_conflict_do_nothing(index_elements=conflict_columns)
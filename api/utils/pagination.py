@@ -2,29 +2,134 @@
 
 from __future__ import annotations
 
+import base64
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from sqlalchemy import func
+
+if TYPE_CHECKING:
+    from sqlalchemy import Row
+    from sqlalchemy.orm import Query
+
+    from schemas.dictionary import PaginatedResponse
+
+
+def fetch_offset_page(
+    query: Query[Any], skip: int, limit: int
+) -> tuple[list[Row[Any]], int]:
+    """Fetch an OFFSET page together with the total number of matching rows.
+
+    ``COUNT(*) OVER ()`` is evaluated before LIMIT/OFFSET, so each page row
+    carries the filtered total and no separate ``query.count()`` round-trip is
+    needed. Only a page past the end (no rows to carry it) falls back to a
+    count. The extra ``total_rows`` column is not a schema field, so
+    ``construct_rows`` drops it.
+
+    Not suitable for ``DISTINCT`` queries: the window column would take part
+    in the de-duplication and count rows before it.
+
+    Args:
+        query: Filtered and ordered column query
+        skip: Rows to skip (OFFSET)
+        limit: Page size (LIMIT)
+
+    Returns:
+        Tuple of (page rows, total matching rows)
+    """
+    rows = (
+        query.add_columns(func.count().over().label("total_rows"))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if rows:
+        return rows, rows[0].total_rows
+    return rows, query.count() if skip else 0
+
+
+def encode_text_cursor(text: str, row_id: int) -> str:
+    """Encode a ``(text, id)`` sort key as an opaque, URL-safe page cursor.
+
+    Args:
+        text: Sort column value of the last row on the page
+        row_id: Primary key of that row, breaking ties between equal texts
+
+    Returns:
+        Cursor string for the next page
+    """
+    return base64.urlsafe_b64encode(orjson.dumps([text, row_id])).decode()
+
+
+def decode_text_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor made by ``encode_text_cursor``.
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        Tuple of (text, id) to seek past
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except ValueError as e:  # binascii.Error and JSONDecodeError included
+        msg = "Malformed page cursor"
+        raise ValueError(msg) from e
+    match key:
+        case [str(text), int(row_id)] if not isinstance(row_id, bool):
+            return text, row_id
+        case _:
+            msg = "Malformed page cursor"
+            raise ValueError(msg)
+
 
 def build_paginated_response[T](
-    items: list[T], total: int, page: int, page_size: int
-) -> dict[str, list[T] | int | bool]:
+    response_model: type[PaginatedResponse[T]],
+    items: list[T],
+    total: int | None,
+    page: int,
+    page_size: int,
+    *,
+    next_cursor: int | None = None,
+    next_page_cursor: str | None = None,
+    has_more: bool | None = None,
+) -> PaginatedResponse[T]:
     """Build a paginated response from query results.
 
+    The response is assembled with ``model_construct``: the items are already
+    schema instances and the metadata is computed here, so a validation pass
+    over the whole page would only re-check them.
+
     Args:
+        response_model: Parametrized response schema, e.g. ``PaginatedWords``
         items: List of items for the current page
-        total: Total number of items across all pages
+        total: Total number of items across all pages, or None when the query
+            skipped counting (cursor pagination); ``has_more`` is then required
         page: Current page number (1-indexed)
         page_size: Number of items per page
+        next_cursor: Keyset cursor for the next page (keyset pagination only)
+        next_page_cursor: Opaque cursor for the next page in sort order
+        has_more: Whether more rows follow, when known from the query itself
+            (keyset pagination); derived from page and total otherwise
 
     Returns:
-        Dictionary with pagination metadata and data
+        Response with pagination metadata and data
     """
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-    has_more = page < total_pages
-
-    return {
-        "data": items,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages,
-        "has_more": has_more,
-    }
+    # Ceiling division; a total of 0 gives 0 pages
+    total_pages = None if total is None else -(-total // page_size)
+    if has_more is None:
+        has_more = total_pages is not None and page < total_pages
+
+    return response_model.model_construct(
+        data=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more,
+        next_cursor=next_cursor,
+        next_page_cursor=next_page_cursor,
+    )
@@ -0,0 +1,62 @@
+"""Build response schemas straight from database rows."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Row
+    from sqlalchemy.orm import InstrumentedAttribute
+
+
+def model_columns(
+    entity: type[Any], model: type[BaseModel]
+) -> list[InstrumentedAttribute[Any]]:
+    """Select the ORM columns backing each field of a flat response schema.
+
+    Args:
+        entity: ORM model class (e.g., ``Word``)
+        model: Response schema whose field names match the entity's columns
+
+    Returns:
+        Column attributes to pass to ``with_entities``/``select``
+    """
+    return [getattr(entity, name) for name in model.model_fields]
+
+
+def construct_row[M: BaseModel, *Ts](model: type[M], row: Row[*Ts], **extra: Any) -> M:
+    """Build one response schema from a row without running validation.
+
+    Rows come from typed database columns, so per-field validation would only
+    re-check what the schema already guarantees.
+
+    Args:
+        model: Response schema to build
+        row: Row selected with ``model_columns(entity, model)``
+        **extra: Fields not among the row's columns (e.g., nested collections)
+
+    Returns:
+        Schema instance
+    """
+    # Row._mapping is SQLAlchemy's public name-keyed view despite the underscore
+    fields = row._mapping  # pyright: ignore[reportPrivateUsage]
+    return model.model_construct(**fields, **extra)
+
+
+def construct_rows[M: BaseModel, *Ts](
+    model: type[M], rows: Sequence[Row[*Ts]]
+) -> list[M]:
+    """Build response schemas from rows without running validation.
+
+    Args:
+        model: Response schema to build
+        rows: Rows selected with ``model_columns(entity, model)``
+
+    Returns:
+        One schema instance per row
+    """
+    return [construct_row(model, row) for row in rows]
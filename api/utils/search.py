@@ -0,0 +1,65 @@
+"""Helpers for user-supplied search filters."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import InstrumentedAttribute
+
+# Escape character for LIKE patterns built from user input
+_LIKE_ESCAPE = "\\"
+
+
+def ilike_prefix(
+    column: InstrumentedAttribute[Any], search: str
+) -> ColumnElement[bool]:
+    """Case-insensitive prefix match on a column, treating ``search`` literally.
+
+    Compiles to ``lower(column) LIKE 'search%'`` rather than ILIKE, so an
+    expression index on ``lower(column) text_pattern_ops`` turns the match into
+    a B-tree range scan for any prefix length (trigram indexes need three
+    characters to narrow anything down).
+
+    ``%`` and ``_`` in the search text are escaped, so "50%" matches names
+    starting with "50%" instead of every name starting with "50".
+
+    Args:
+        column: String column to filter
+        search: Raw search text from the request
+
+    Returns:
+        ``lower(column) LIKE 'search%'`` with the search text lowered and escaped
+    """
+    escaped = _escape_like(search.lower())
+    return func.lower(column).like(f"{escaped}%", escape=_LIKE_ESCAPE)
+
+
+def ilike_contains(
+    column: InstrumentedAttribute[Any], search: str
+) -> ColumnElement[bool]:
+    """Case-insensitive substring match on a column, treating ``search`` literally.
+
+    Compiles to ``column ILIKE '%search%'``, which the pg_trgm GIN indexes on
+    the searched columns serve once the text has three or more characters.
+
+    Args:
+        column: String column to filter
+        search: Raw search text from the request
+
+    Returns:
+        ``column ILIKE '%search%'`` with the search text escaped
+    """
+    return column.ilike(f"%{_escape_like(search)}%", escape=_LIKE_ESCAPE)
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so they match literally."""
+    return (
+        text.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", _LIKE_ESCAPE + "%")
+        .replace("_", _LIKE_ESCAPE + "_")
+    )
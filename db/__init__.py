@@ -2,6 +2,24 @@
 
 from __future__ import annotations
 
-from db.base import Base, SessionLocal, engine, get_db
+from db.base import (
+    AsyncSessionLocal,
+    Base,
+    SessionLocal,
+    async_engine,
+    engine,
+    get_async_db,
+    get_db,
+    warm_pool,
+)
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "SessionLocal",
+    "async_engine",
+    "engine",
+    "get_async_db",
+    "get_db",
+    "warm_pool",
+]
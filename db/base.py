@@ -7,13 +7,18 @@ Uses SQLAlchemy 2.0 with async support and Neon PostgreSQL.
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import AsyncGenerator, Generator
+
+    from sqlalchemy import Connection
 
 # Get DATABASE_URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -21,14 +26,71 @@ if DATABASE_URL is None:
     msg = "DATABASE_URL environment variable must be set"
     raise ValueError(msg)
 
+# Connection pool sizing. Sync routes run in FastAPI's threadpool (40 threads),
+# so the default 5 + 10 pool queues requests under load
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Seconds to wait for a free connection before raising
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds before a pooled connection is replaced, ahead of server-side idle
+# timeouts (Neon, proxies) closing it
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Set when DATABASE_URL points at an external transaction pooler (PgBouncer,
+# Neon's "-pooler" endpoint): SQLAlchemy then opens a connection per checkout
+# instead of pooling on top of the pooler
+DB_EXTERNAL_POOLER = os.getenv("DB_EXTERNAL_POOLER", "").lower() in {"1", "true"}
+# Per-statement server timeout in milliseconds (0 disables it)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+_connect_args: dict[str, Any] = {}
+if DB_STATEMENT_TIMEOUT_MS > 0:
+    _connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+
+_pool_args: dict[str, Any]
+if DB_EXTERNAL_POOLER:
+    _pool_args = {"poolclass": NullPool}
+    # Transaction pooling hands each transaction a different server
+    # connection, so psycopg's server-side prepared statements cannot be reused
+    _connect_args["prepare_threshold"] = None
+else:
+    _pool_args = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        # Reuse the most recent connection so surplus ones idle out server-side
+        "pool_use_lifo": True,
+    }
+
 # Create engine with connection pooling
 # pool_pre_ping ensures connections are alive before using them
 engine = create_engine(
     DATABASE_URL,
+    **_pool_args,
+    connect_args=_connect_args,
     pool_pre_ping=True,
     echo=False,  # Set to True for SQL query logging
 )
 
+# Async engine for code running on the event loop (startup checks, health probes).
+# psycopg 3 provides both drivers, so the same DATABASE_URL (including Neon's
+# sslmode/channel_binding options) works for both engines.
+async_engine = create_async_engine(
+    DATABASE_URL,
+    **(
+        _pool_args
+        if DB_EXTERNAL_POOLER
+        else {"pool_recycle": DB_POOL_RECYCLE, "pool_use_lifo": True}
+    ),
+    connect_args=_connect_args,
+    pool_pre_ping=True,
+    echo=False,
+)
+
+# Number of pooled connections to open at startup (0 disables warming)
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "5"))
+
 # Session factory for creating database sessions
 SessionLocal = sessionmaker(
     bind=engine,
@@ -38,6 +100,58 @@ SessionLocal = sessionmaker(
 )
 
 
+def warm_pool(size: int = DB_POOL_WARM) -> int:
+    """Open pooled connections concurrently so first requests skip the handshake.
+
+    Each connection runs ``SELECT 1`` and is returned to the pool, leaving it
+    established and idle. Capped at the pool size, since overflow connections
+    are discarded on release.
+
+    Args:
+        size: Number of connections to open
+
+    Returns:
+        Number of connections warmed
+
+    Raises:
+        SQLAlchemyError: If a connection cannot be established
+    """
+    if isinstance(engine.pool, NullPool):
+        # Released connections are closed, so there is nothing to keep warm
+        return 0
+    count = (
+        min(size, engine.pool.size()) if isinstance(engine.pool, QueuePool) else size
+    )
+    if count <= 0:
+        return 0
+
+    def _open() -> Connection:
+        conn = engine.connect()
+        _ = conn.execute(text("SELECT 1"))
+        return conn
+
+    # Hold every connection until all are open, otherwise the pool hands the
+    # same one back to the next worker
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures: list[Future[Connection]] = [
+            executor.submit(_open) for _ in range(count)
+        ]
+    try:
+        return len([future.result() for future in futures])
+    finally:
+        for future in futures:
+            if future.exception() is None:
+                future.result().close()
+
+
+# Async session factory for async route handlers
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
@@ -58,3 +172,18 @@ def get_db() -> Generator[Session]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession]:
+    """Dependency for async FastAPI routes to get an async database session.
+
+    Yields:
+        AsyncSession: A SQLAlchemy async database session.
+
+    Example:
+        @router.get("/words")
+        async def get_words(db: AsyncSession = Depends(get_async_db)):
+            return (await db.scalars(select(Word))).all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -9,6 +9,15 @@ from db.models.dictionary import (
     Word,
     WordRelation,
     WordTag,
+    touch_word,
 )
 
-__all__ = ["Definition", "Example", "Tag", "Word", "WordRelation", "WordTag"]
+__all__ = [
+    "Definition",
+    "Example",
+    "Tag",
+    "Word",
+    "WordRelation",
+    "WordTag",
+    "touch_word",
+]
@@ -9,8 +9,9 @@ This module defines a normalized relational schema for storing dictionary data:
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     CheckConstraint,
@@ -21,15 +22,23 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    bindparam,
     event,
+    func,
+    or_,
+    select,
+    update,
 )
 from sqlalchemy import (
     Enum as SQLEnum,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from db.base import Base
 
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+
 
 class PartOfSpeech(str, Enum):
     """Part of speech for definitions."""
@@ -70,47 +79,61 @@ class Word(Base):
     __tablename__ = "words"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    word_text: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    word_text: Mapped[str] = mapped_column(String(255), nullable=False)
     language_code: Mapped[str] = mapped_column(
         String(10), nullable=False, index=True
     )  # e.g., "en", "es", "fr"
+    # Timestamps come from the database: inserts leave them out, updates render
+    # now() inline, and no per-row Python datetime is bound
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    # Relationships
+    # Relationships. Child rows go through the ON DELETE CASCADE foreign keys, so
+    # passive_deletes keeps the ORM from loading collections just to delete them
     definitions: Mapped[list[Definition]] = relationship(
         "Definition",
         back_populates="word",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     tags: Mapped[list[Tag]] = relationship(
         "Tag",
         secondary="word_tags",
         back_populates="words",
+        passive_deletes=True,
     )
     word_forms: Mapped[list[WordForm]] = relationship(
         "WordForm",
         back_populates="word",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     # Self-referential relationships for word relations
     # This is handled via the WordRelation table
 
     __table_args__ = (
-        # Ensure unique (word_text, language_code) pairs
+        # Ensure unique (word_text, language_code) pairs. Its index also serves
+        # the (language, text) lookup and plain word_text equality
         UniqueConstraint("word_text", "language_code", name="uq_word_language"),
-        # Index for searching by word prefix
-        Index("idx_word_text_lower", "word_text"),
+        # Alphabetical keyset pages seek on (word_text, id)
+        Index("idx_word_text_id", "word_text", "id"),
+        # Trigram index serving case-insensitive (ILIKE) search (pg_trgm)
+        Index(
+            "idx_word_text_trgm",
+            "word_text",
+            postgresql_using="gin",
+            postgresql_ops={"word_text": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -144,6 +167,7 @@ class Definition(Base):
         "Example",
         back_populates="definition",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -229,6 +253,8 @@ class WordRelation(Base):
         CheckConstraint("word_id_1 != word_id_2", name="ck_no_self_relation"),
         # Index for efficient lookups
         Index("idx_word_relation", "word_id_1", "word_id_2", "relation_type"),
+        # The primary key leads with word_id_1; relation lists also match word_id_2
+        Index("idx_word_relation_word_id_2", "word_id_2"),
     )
 
     def __repr__(self) -> str:
@@ -254,6 +280,7 @@ class Tag(Base):
         "Word",
         secondary="word_tags",
         back_populates="tags",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -277,8 +304,9 @@ class WordTag(Base):
     )
 
     __table_args__ = (
-        # Index for efficient lookups
-        Index("idx_word_tag", "word_id", "tag_id"),
+        # The (word_id, tag_id) primary key serves lookups by word; this serves
+        # lookups by tag, including the ON DELETE CASCADE from tags
+        Index("idx_word_tag_tag_id", "tag_id"),
     )
 
     def __repr__(self) -> str:
@@ -302,7 +330,7 @@ class WordForm(Base):
         index=True,
     )
     form_text: Mapped[str] = mapped_column(
-        String(255), nullable=False, index=True
+        String(255), nullable=False
     )  # e.g., "defying", "defied"
     form_type: Mapped[str | None] = mapped_column(
         String(50), nullable=True
@@ -316,6 +344,13 @@ class WordForm(Base):
         UniqueConstraint("word_id", "form_text", name="uq_word_form"),
         # Index for fast lookup by form text
         Index("idx_form_text", "form_text"),
+        # Trigram index serving case-insensitive (ILIKE) search (pg_trgm)
+        Index(
+            "idx_form_text_trgm",
+            "form_text",
+            postgresql_using="gin",
+            postgresql_ops={"form_text": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -324,54 +359,81 @@ class WordForm(Base):
         )
 
 
+# ============================================================================
+# Prefix Search Indexes
+# ============================================================================
+
+# Prefix search matches lower(column) LIKE 'x%' (api.utils.ilike_prefix), and
+# text_pattern_ops lets the B-tree serve LIKE under non-C collations
+Index(
+    "idx_word_text_lower_pattern",
+    func.lower(Word.word_text).label("word_text_lower"),
+    postgresql_ops={"word_text_lower": "text_pattern_ops"},
+)
+Index(
+    "idx_form_text_lower_pattern",
+    func.lower(WordForm.form_text).label("form_text_lower"),
+    postgresql_ops={"form_text_lower": "text_pattern_ops"},
+)
+Index(
+    "idx_tag_name_lower_pattern",
+    func.lower(Tag.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+)
+
+
 # ============================================================================
 # Event Listeners - Auto-update Word.updated_at on nested data changes
 # ============================================================================
 
 
-def _update_word_timestamp(word_id: int, connection: object) -> None:
-    """Update Word.updated_at timestamp efficiently."""
-    # Use update() for efficiency - avoids loading the full Word object
-    from sqlalchemy import update
+# Built once: services touch a word after every nested write
+_TOUCH_WORD = (
+    update(Word).where(Word.id == bindparam("word_id")).values(updated_at=func.now())
+)
 
-    stmt = update(Word).where(Word.id == word_id).values(updated_at=datetime.now(UTC))
-    connection.execute(stmt)  # type: ignore[attr-defined]
 
+def touch_word(word_id: int | ColumnElement[int], connection: object) -> None:
+    """Update Word.updated_at timestamp efficiently.
 
-# Definition events - update parent Word timestamp
-@event.listens_for(Definition, "after_insert")
-@event.listens_for(Definition, "after_update")
-@event.listens_for(Definition, "after_delete")
-def _update_word_on_definition_change(  # pyright: ignore[reportUnusedFunction]
-    mapper: object, connection: object, target: Definition
-) -> None:  # noqa: ARG001
-    """Update parent Word timestamp when definition changes."""
-    _update_word_timestamp(target.word_id, connection)
+    Also called directly by services that change nested rows with bulk
+    INSERT/UPDATE/DELETE statements, which bypass the flush listener below.
+    ``word_id`` may be a scalar subquery so the lookup happens inside the same
+    statement.
+    """
+    # Use update() for efficiency - avoids loading the full Word object
+    if isinstance(word_id, int):
+        connection.execute(_TOUCH_WORD, {"word_id": word_id})  # type: ignore[attr-defined]
+        return
 
+    stmt = update(Word).where(Word.id == word_id).values(updated_at=func.now())
+    connection.execute(stmt)  # type: ignore[attr-defined]
 
-# Example events - update grandparent Word timestamp via Definition
-@event.listens_for(Example, "after_insert")
-@event.listens_for(Example, "after_update")
-@event.listens_for(Example, "after_delete")
-def _update_word_on_example_change(  # pyright: ignore[reportUnusedFunction]
-    mapper: object, connection: object, target: Example
-) -> None:  # noqa: ARG001
-    """Update grandparent Word timestamp when example changes."""
-    # Get the parent definition's word_id
-    from sqlalchemy import select
-
-    stmt = select(Definition.word_id).where(Definition.id == target.definition_id)
-    result = connection.execute(stmt)  # type: ignore[attr-defined]
-    row = result.fetchone()
-    if row:
-        _update_word_timestamp(row[0], connection)
-
-
-# WordTag events - update parent Word timestamp
-@event.listens_for(WordTag, "after_insert")
-@event.listens_for(WordTag, "after_delete")
-def _update_word_on_tag_change(  # pyright: ignore[reportUnusedFunction]
-    mapper: object, connection: object, target: WordTag
+
+# Flush events - update the Word timestamp of changed definitions, examples
+# and tag links with one UPDATE per flush rather than one per row
+@event.listens_for(Session, "after_flush")
+def _touch_words_after_flush(  # pyright: ignore[reportUnusedFunction]
+    session: Session, flush_context: object
 ) -> None:  # noqa: ARG001
-    """Update parent Word timestamp when tags change."""
-    _update_word_timestamp(target.word_id, connection)
+    """Update the timestamp of every Word whose nested rows were flushed."""
+    word_ids: set[int] = set()
+    definition_ids: set[int] = set()
+    for target in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(target, Definition | WordTag):
+            word_ids.add(target.word_id)
+        elif isinstance(target, Example):
+            definition_ids.add(target.definition_id)
+    if not word_ids and not definition_ids:
+        return
+
+    # Examples reach their word through the definition, inside the same UPDATE
+    touched = or_(
+        Word.id.in_(word_ids),
+        Word.id.in_(
+            select(Definition.word_id).where(Definition.id.in_(definition_ids))
+        ),
+    )
+    _ = session.connection().execute(
+        update(Word).where(touched).values(updated_at=func.now())
+    )
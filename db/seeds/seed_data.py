@@ -7,8 +7,10 @@ Usage:
 
 from __future__ import annotations
 
+import itertools
 import json
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -40,11 +42,24 @@ def load_json_file(file_path: Path) -> list[dict[str, Any]]:
     return data
 
 
+# Words per bulk POST; the create endpoint accepts up to 10,000 per request
+SEED_BATCH_SIZE = 500
+# Words per page when reading existing words (the list endpoint's maximum)
+FETCH_PAGE_SIZE = 1000
+# Concurrent PATCH requests for words that changed
+SEED_CONCURRENCY = 32
+
+
 def seed_from_json(
     file_path: Path, base_url: str = "http://localhost:8000/v1/dictionary/words"
 ) -> int:
     """Seed database from JSON file with upsert behavior.
 
+    Existing words are read a page at a time, new words are created with bulk
+    POSTs of ``SEED_BATCH_SIZE``, and only words that differ from the seed are
+    PATCHed, up to ``SEED_CONCURRENCY`` at a time, so the number of sequential
+    requests no longer grows with every seed word.
+
     Args:
         file_path: Path to JSON seed file
         base_url: API endpoint URL
@@ -64,47 +79,136 @@ def seed_from_json(
     updated = 0
     unchanged = 0
 
-    with httpx.Client(timeout=60.0) as client:
+    # Keep a socket per concurrent PATCH alive between requests, and retry
+    # connection failures instead of dropping the word
+    limits = httpx.Limits(
+        max_connections=SEED_CONCURRENCY,
+        max_keepalive_connections=SEED_CONCURRENCY,
+        keepalive_expiry=30.0,
+    )
+    transport = httpx.HTTPTransport(limits=limits, retries=2)
+    with httpx.Client(timeout=60.0, transport=transport) as client:
+        languages = {word.get("language_code", "en") for word in words}
+        existing = _fetch_existing_words(client, base_url, languages)
+
+        # Keyed so a word listed twice is created once, with its last entry,
+        # instead of failing the bulk POST as a duplicate
+        new_words: dict[tuple[str, str], dict[str, Any]] = {}
+        changed: list[tuple[int, dict[str, Any]]] = []
         for word in words:
             word_text = word.get("word_text", "unknown")
             lang = word.get("language_code", "en")
-
+            current = existing.get((word_text, lang))
+
+            if current is None:
+                new_words[word_text, lang] = word
+            elif _needs_update(current, word):
+                changed.append((current["id"], word))
+            else:
+                unchanged += 1
+                print(f"  = {word_text} (unchanged)")
+
+        # PATCHes are independent, so overlap their round trips
+        with ThreadPoolExecutor(max_workers=SEED_CONCURRENCY) as executor:
+            futures: list[Future[httpx.Response]] = [
+                executor.submit(client.patch, f"{base_url}/{word_id}", json=word)
+                for word_id, word in changed
+            ]
+        for (_, word), future in zip(changed, futures, strict=True):
+            word_text = word.get("word_text", "unknown")
             try:
-                # Check if word exists
-                get_url = f"{base_url}/{lang}/{word_text}?include_all=true"
-                get_resp = client.get(get_url)
-
-                if get_resp.status_code == 404:
-                    # Word doesn't exist - create it
-                    post_resp = client.post(base_url, json=word)
-                    if post_resp.status_code == 201:
-                        created += 1
-                        print(f"  + {word_text}")
-                    else:
-                        print(f"  x {word_text} - {post_resp.json()}")
-                elif get_resp.status_code == 200:
-                    # Word exists - check if update needed
-                    existing = get_resp.json()
-                    if _needs_update(existing, word):
-                        patch_url = f"{base_url}/{existing['id']}"
-                        patch_resp = client.patch(patch_url, json=word)
-                        if patch_resp.status_code == 200:
-                            updated += 1
-                            print(f"  ~ {word_text} (updated)")
-                        else:
-                            print(f"  x {word_text} - {patch_resp.json()}")
-                    else:
-                        unchanged += 1
-                        print(f"  = {word_text} (unchanged)")
-                else:
-                    print(f"  x {word_text} - {get_resp.json()}")
+                patch_resp = future.result()
             except httpx.HTTPError as e:
                 print(f"  x {word_text} - Error: {e}")
+                continue
+            if patch_resp.status_code == 200:
+                updated += 1
+                print(f"  ~ {word_text} (updated)")
+            else:
+                print(f"  x {word_text} - {patch_resp.json()}")
+
+        for batch in itertools.batched(new_words.values(), SEED_BATCH_SIZE):
+            created += _create_words(client, base_url, list(batch))
 
     print(f"Done: {created} created, {updated} updated, {unchanged} unchanged")
     return created + updated
 
 
+def _create_words(
+    client: httpx.Client, base_url: str, words: list[dict[str, Any]]
+) -> int:
+    """Create a batch of words with one bulk POST.
+
+    The bulk endpoint rejects the whole batch if any word is invalid, so a
+    failed batch is retried one word at a time and only the bad words are lost.
+
+    Args:
+        client: HTTP client
+        base_url: API endpoint URL
+        words: Word payloads to create
+
+    Returns:
+        Number of words created
+    """
+    try:
+        post_resp = client.post(base_url, json=words)
+    except httpx.HTTPError as e:
+        print(f"  x {len(words)} words - Error: {e}")
+        return 0
+
+    if post_resp.status_code == 201:
+        for word in words:
+            print(f"  + {word.get('word_text', 'unknown')}")
+        return len(words)
+
+    if len(words) == 1:
+        print(f"  x {words[0].get('word_text', 'unknown')} - {post_resp.json()}")
+        return 0
+    return sum(_create_words(client, base_url, [word]) for word in words)
+
+
+def _fetch_existing_words(
+    client: httpx.Client, base_url: str, languages: set[str]
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Read every stored word of the given languages with its nested data.
+
+    Pages by the ``after_id`` keyset cursor, one request per
+    ``FETCH_PAGE_SIZE`` words.
+
+    Args:
+        client: HTTP client
+        base_url: API endpoint URL
+        languages: Language codes to read
+
+    Returns:
+        Words keyed by ``(word_text, language_code)``
+
+    Raises:
+        httpx.HTTPError: If a page cannot be fetched
+    """
+    existing: dict[tuple[str, str], dict[str, Any]] = {}
+    for lang in sorted(languages):
+        after_id = 0
+        while True:
+            resp = client.get(
+                base_url,
+                params={
+                    "language": lang,
+                    "include_all": "true",
+                    "page_size": FETCH_PAGE_SIZE,
+                    "after_id": after_id,
+                },
+            )
+            _ = resp.raise_for_status()
+            page = resp.json()
+            for word in page["data"]:
+                existing[word["word_text"], word["language_code"]] = word
+            if not page["has_more"]:
+                break
+            after_id = page["next_cursor"]
+    return existing
+
+
 def _needs_update(existing: dict[str, Any], seed: dict[str, Any]) -> bool:
     """Check if existing word differs from seed data."""
     # Compare definitions
@@ -16,12 +16,13 @@ from hf_hub.config import (
     get_hf_token,
     get_repo_id,
 )
-from hf_hub.model_manager import ModelManager
+from hf_hub.model_manager import ModelManager, get_manager
 
 __all__ = [
     "ModelManager",
     "get_cache_dir",
     "get_default_model",
     "get_hf_token",
+    "get_manager",
     "get_repo_id",
 ]
@@ -1,5 +1,6 @@
 """Hugging Face Hub configuration."""
 
+import functools
 import os
 from pathlib import Path
 
@@ -32,9 +33,27 @@ def get_repo_id() -> str:
     return repo_id
 
 
+def prefer_cached_files() -> bool:
+    """Whether model files should be resolved from the local cache first.
+
+    On in production (ENV=production), whose cache lives on a persistent volume,
+    or when HF_PREFER_CACHE is set. Elsewhere every fetch checks the Hub, so a
+    re-uploaded model is picked up.
+
+    Returns:
+        True to try the cache before contacting the Hub
+    """
+    if os.getenv("ENV") == "production":
+        return True
+    return os.getenv("HF_PREFER_CACHE", "").lower() in {"1", "true", "yes"}
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_model() -> str:
     """Get default model name from environment.
 
+    Resolved once per process; a missing value raises and is not cached.
+
     Returns:
         Default model name
 
@@ -54,8 +73,13 @@ def get_default_model() -> str:
 def get_cache_dir() -> Path:
     """Get local cache directory for downloaded models.
 
+    Falls back to HUGGINGFACE_HUB_CACHE so the API shares the hub's persistent
+    cache when no explicit HF_CACHE_DIR is configured.
+
     Returns:
         Path to cache directory
     """
-    cache_dir = os.getenv("HF_CACHE_DIR", ".hf_cache")
+    cache_dir = os.getenv("HF_CACHE_DIR") or os.getenv(
+        "HUGGINGFACE_HUB_CACHE", ".hf_cache"
+    )
     return Path(cache_dir)
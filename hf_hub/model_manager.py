@@ -1,13 +1,20 @@
 """Model manager for Hugging Face Hub integration."""
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 from huggingface_hub import hf_hub_download
-
-from hf_hub.config import get_cache_dir, get_hf_token, get_repo_id
+from huggingface_hub.utils import LocalEntryNotFoundError
+
+from hf_hub.config import (
+    get_cache_dir,
+    get_hf_token,
+    get_repo_id,
+    prefer_cached_files,
+)
 from neural_networks.core import NeuralNetwork
 
 
@@ -50,31 +57,47 @@ class ModelManager:
         Raises:
             Exception: If download fails
         """
-        model_filename = f"{model_name}.npz"
-        metadata_filename = f"{model_name}.json"
+        model_path = self._fetch(f"{model_name}.npz")
+        metadata_path = self._fetch(f"{model_name}.json")
+        return model_path, metadata_path
 
-        # Download model file
-        model_path = Path(
-            hf_hub_download(
-                repo_id=self.repo_id,
-                filename=model_filename,
-                cache_dir=str(self.cache_dir),
-                token=self.token,
-            )
-        )
+    def _fetch(self, filename: str) -> Path:
+        """Resolve a repo file, preferring the local cache when configured to.
+
+        With ``prefer_cached_files()`` a cached snapshot is returned without
+        contacting the Hub, so warm restarts never pay a metadata round-trip and
+        only a cache miss falls through to a download. Otherwise the Hub is asked
+        for the current revision, which still reuses the cache when it is fresh.
+
+        Args:
+            filename: File name inside the HF Hub repository
 
-        # Download metadata file
-        metadata_path = Path(
+        Returns:
+            Local path to the file
+        """
+        if prefer_cached_files():
+            try:
+                return Path(
+                    hf_hub_download(
+                        repo_id=self.repo_id,
+                        filename=filename,
+                        cache_dir=str(self.cache_dir),
+                        token=self.token,
+                        local_files_only=True,
+                    )
+                )
+            except LocalEntryNotFoundError:
+                pass
+
+        return Path(
             hf_hub_download(
                 repo_id=self.repo_id,
-                filename=metadata_filename,
+                filename=filename,
                 cache_dir=str(self.cache_dir),
                 token=self.token,
             )
         )
 
-        return model_path, metadata_path
-
     def load_metadata(self, metadata_path: Path) -> dict[str, Any]:
         """Load model metadata from JSON file.
 
@@ -164,3 +187,16 @@ class ModelManager:
 
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_manager() -> ModelManager:
+    """Get the process-wide model manager configured from the environment.
+
+    Reused across app restarts within the same process so env parsing and
+    cache-dir setup only happen once.
+
+    Returns:
+        Shared ModelManager instance
+    """
+    return ModelManager()
@@ -14,6 +14,7 @@ import numpy.typing as npt
 NDArrayFloat = npt.NDArray[np.floating]
 NDArrayInt = npt.NDArray[np.int_]
 type DataPair = tuple[NDArrayFloat, NDArrayFloat]
+type DataArrays = tuple[NDArrayFloat, NDArrayFloat]
 
 
 class MNISTLoader:
@@ -34,6 +35,53 @@ class MNISTLoader:
             - label is (10, 1) one-hot encoded vector for training/validation
             - label is integer for test data
 
+        Raises:
+            RuntimeError: If download or processing fails
+        """
+        training_data, validation_data, test_data = cls._load_raw()
+
+        return (
+            cls._format_training_data(training_data),
+            cls._format_training_data(validation_data),
+            cls._format_test_data(test_data),
+        )
+
+    @classmethod
+    def load_arrays(cls) -> tuple[DataArrays, DataArrays, DataArrays]:
+        """Load MNIST dataset as contiguous arrays, downloading if necessary.
+
+        Same data as ``load_data`` but one array per split instead of a list of
+        per-sample pairs, so training can index mini-batches directly.
+
+        Returns:
+            Tuple of (training, validation, test) splits, each (inputs, labels) where:
+            - inputs is (n, 784) float32 array of pixel values [0, 1]
+            - labels is (n, 10) float32 one-hot array
+
+        Raises:
+            RuntimeError: If download or processing fails
+        """
+        training_data, validation_data, test_data = cls._load_raw()
+
+        return (
+            _to_arrays(training_data),
+            _to_arrays(validation_data),
+            _to_arrays(test_data),
+        )
+
+    @classmethod
+    def _load_raw(
+        cls,
+    ) -> tuple[
+        tuple[NDArrayFloat, NDArrayInt],
+        tuple[NDArrayFloat, NDArrayInt],
+        tuple[NDArrayFloat, NDArrayInt],
+    ]:
+        """Read the pickled (inputs, labels) splits, downloading if necessary.
+
+        Returns:
+            Tuple of (training, validation, test) splits as stored in the archive
+
         Raises:
             RuntimeError: If download or processing fails
         """
@@ -42,19 +90,11 @@ class MNISTLoader:
 
         try:
             with gzip.open(cls.MNIST_FILE, "rb") as f:
-                training_data, validation_data, test_data = pickle.load(
-                    f, encoding="latin1"
-                )
+                return pickle.load(f, encoding="latin1")
         except Exception as e:
             msg = f"Failed to load MNIST data: {e}"
             raise RuntimeError(msg) from e
 
-        return (
-            cls._format_training_data(training_data),
-            cls._format_training_data(validation_data),
-            cls._format_test_data(test_data),
-        )
-
     @classmethod
     def _download_mnist(cls) -> None:
         """Download MNIST dataset from repository.
@@ -83,7 +123,7 @@ class MNISTLoader:
             List of (input, one_hot_label) pairs
         """
         inputs, labels = data
-        formatted_inputs = [np.reshape(x, (784, 1)).astype(np.float64) for x in inputs]
+        formatted_inputs = [np.reshape(x, (784, 1)).astype(np.float32) for x in inputs]
         formatted_labels = [_vectorize_label(y) for y in labels]
         return list(zip(formatted_inputs, formatted_labels, strict=False))
 
@@ -100,11 +140,27 @@ class MNISTLoader:
             List of (input, one_hot_label) pairs
         """
         inputs, labels = data
-        formatted_inputs = [np.reshape(x, (784, 1)).astype(np.float64) for x in inputs]
+        formatted_inputs = [np.reshape(x, (784, 1)).astype(np.float32) for x in inputs]
         formatted_labels = [_vectorize_label(y) for y in labels]
         return list(zip(formatted_inputs, formatted_labels, strict=False))
 
 
+def _to_arrays(data: tuple[NDArrayFloat, NDArrayInt]) -> DataArrays:
+    """Convert a raw split to contiguous float32 inputs and one-hot labels.
+
+    Args:
+        data: Tuple of (inputs, labels) where inputs are (n, 784) and labels are (n,)
+
+    Returns:
+        Tuple of (n, 784) inputs and (n, 10) one-hot labels
+    """
+    inputs, labels = data
+    return (
+        np.ascontiguousarray(inputs, dtype=np.float32),
+        np.eye(10, dtype=np.float32)[labels],
+    )
+
+
 def _vectorize_label(j: int) -> NDArrayFloat:
     """Convert digit to one-hot encoded vector.
 
@@ -114,7 +170,7 @@ def _vectorize_label(j: int) -> NDArrayFloat:
     Returns:
         One-hot encoded (10, 1) vector
     """
-    e = np.zeros((10, 1), dtype=np.float64)
+    e = np.zeros((10, 1), dtype=np.float32)
     e[j] = 1.0
     return e
 
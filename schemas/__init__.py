@@ -20,6 +20,7 @@ from schemas.dictionary import (
     TagOut,
     TagUpdate,
     WordCreate,
+    WordCreateBatch,
     WordFull,
     WordOut,
     WordUpdate,
@@ -27,6 +28,8 @@ from schemas.dictionary import (
 from schemas.inference import (
     ActivationsInput,
     ActivationsOutput,
+    BatchPredictionInput,
+    BatchPredictionOutput,
     PredictionInput,
     PredictionOutput,
 )
@@ -34,6 +37,8 @@ from schemas.inference import (
 __all__ = [
     "ActivationsInput",
     "ActivationsOutput",
+    "BatchPredictionInput",
+    "BatchPredictionOutput",
     # Dictionary - Definitions
     "DefinitionNested",
     "DefinitionOut",
@@ -57,6 +62,7 @@ __all__ = [
     "TagUpdate",
     # Dictionary - Words
     "WordCreate",
+    "WordCreateBatch",
     "WordFull",
     "WordOut",
     "WordUpdate",
@@ -6,6 +6,7 @@ Clean, modern schemas supporting nested data operations.
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Annotated, Final
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -100,6 +101,13 @@ class WordCreate(BaseModel):
     )
 
 
+# Largest word list accepted by one bulk create request
+MAX_BULK_WORDS: Final = 10_000
+
+# Bulk create payload: one transaction and a multi-row INSERT per table
+WordCreateBatch = Annotated[list[WordCreate], Field(max_length=MAX_BULK_WORDS)]
+
+
 class WordUpdate(BaseModel):
     """Word update schema - all fields optional, supports nested data."""
 
@@ -207,11 +215,19 @@ class PaginatedResponse[T](BaseModel):
     """Generic paginated response."""
 
     data: list[T]
-    total: int = Field(..., ge=0)
+    total: int | None = Field(
+        ..., ge=0, description="Matching rows; null when paging by cursor"
+    )
     page: int = Field(..., ge=1)
     page_size: int = Field(..., ge=1)
-    total_pages: int = Field(..., ge=0)
+    total_pages: int | None = Field(..., ge=0)
     has_more: bool
+    next_cursor: int | None = Field(
+        None, description="Pass as after_id to fetch the next page (keyset pagination)"
+    )
+    next_page_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the next page in sort order"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
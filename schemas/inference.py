@@ -1,16 +1,55 @@
 """Pydantic schemas for inference operations."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Final, Self
 
+from pydantic import Base64Bytes, BaseModel, Field, model_validator
+
+PIXEL_COUNT: Final = 784
+
+# Byte length of a base64 ``pixels_b64`` payload: 784 little-endian float32 values
+PIXEL_BYTES: Final = PIXEL_COUNT * 4
 
-class PredictionInput(BaseModel):
-    """Input for network prediction."""
 
-    pixels: list[float] = Field(
-        min_length=784,
-        max_length=784,
+class ImageInput(BaseModel):
+    """A single 28x28 image, as a JSON list or a base64 float32 blob."""
+
+    pixels: list[float] | None = Field(
+        None,
+        min_length=PIXEL_COUNT,
+        max_length=PIXEL_COUNT,
         description="Flattened 28x28 image (784 pixels), normalized [0, 1]",
     )
+    pixels_b64: Base64Bytes | None = Field(
+        None,
+        description=(
+            "Alternative to pixels: base64 of 784 little-endian float32 values "
+            "(3136 bytes), decoded without per-element float parsing"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _check_pixel_source(self) -> Self:
+        """Require exactly one pixel encoding with the right length.
+
+        Returns:
+            The validated input
+
+        Raises:
+            ValueError: If both or neither encodings are given, or the blob size
+                is wrong
+        """
+        if (self.pixels is None) == (self.pixels_b64 is None):
+            msg = "Provide exactly one of 'pixels' or 'pixels_b64'"
+            raise ValueError(msg)
+        if self.pixels_b64 is not None and len(self.pixels_b64) != PIXEL_BYTES:
+            size = len(self.pixels_b64)
+            msg = f"'pixels_b64' must decode to {PIXEL_BYTES} bytes, got {size}"
+            raise ValueError(msg)
+        return self
+
+
+class PredictionInput(ImageInput):
+    """Input for network prediction."""
 
 
 class PredictionOutput(BaseModel):
@@ -21,16 +60,26 @@ class PredictionOutput(BaseModel):
     probabilities: list[float] = Field(min_length=10, max_length=10)
 
 
-class ActivationsInput(BaseModel):
-    """Input for getting all layer activations."""
+class BatchPredictionInput(BaseModel):
+    """Input for batched network prediction."""
 
-    pixels: list[float] = Field(
-        min_length=784,
-        max_length=784,
-        description="Flattened 28x28 image",
+    pixels: list[Annotated[list[float], Field(min_length=784, max_length=784)]] = Field(
+        min_length=1,
+        max_length=1000,
+        description="Flattened 28x28 images (784 pixels each), normalized [0, 1]",
     )
 
 
+class BatchPredictionOutput(BaseModel):
+    """Batched network prediction output, in input order."""
+
+    predictions: list[PredictionOutput]
+
+
+class ActivationsInput(ImageInput):
+    """Input for getting all layer activations."""
+
+
 class ActivationsOutput(BaseModel):
     """All layer activations for visualization."""
 
@@ -0,0 +1,189 @@
+"""Tests for the optional Redis response cache."""
+
+from collections.abc import Generator, Iterator
+from fnmatch import fnmatchcase
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from redis import RedisError
+from sqlalchemy.orm import Session
+
+from api.cache import cached, invalidate, invalidate_on_commit
+from schemas.dictionary import TagOut
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the cache uses."""
+
+    def __init__(self) -> None:
+        """Start with an empty store and a healthy connection."""
+        self.store: dict[str, str] = {}
+        self.failing = False
+
+    def _check(self) -> None:
+        if self.failing:
+            raise RedisError("connection lost")
+
+    def get(self, key: str) -> str | None:
+        """Return the value stored under ``key``, if any."""
+        self._check()
+        return self.store.get(key)
+
+    def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        """Store ``value`` under ``key``; expiry is not simulated."""
+        self._check()
+        self.store[key] = value
+        return True
+
+    def scan_iter(self, match: str, count: int | None = None) -> Iterator[str]:
+        """Yield the keys matching a glob pattern."""
+        self._check()
+        return iter([key for key in self.store if fnmatchcase(key, match)])
+
+    def unlink(self, *keys: str) -> int:
+        """Delete the given keys."""
+        self._check()
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+@pytest.fixture
+def fake_redis() -> Generator[FakeRedis]:
+    """Enable the cache with an in-memory Redis client.
+
+    Yields:
+        Fake client installed as the cache backend
+    """
+    client = FakeRedis()
+    with patch("api.cache._client", client):
+        yield client
+
+
+def _counting_get_tag() -> tuple[Any, list[int]]:
+    """Build a cached tag lookup that records every database call.
+
+    Returns:
+        The cached function and the list of tag ids it was called with
+    """
+    calls: list[int] = []
+
+    @cached("tags:get", TagOut)
+    def get_tag(db: object, tag_id: int) -> TagOut:
+        calls.append(tag_id)
+        return TagOut(id=tag_id, name=f"tag-{tag_id}", description=None)
+
+    return get_tag, calls
+
+
+# ============================================================================
+# Read-Through Tests
+# ============================================================================
+
+
+def test_cached_miss_then_hit(fake_redis: FakeRedis) -> None:
+    """Test that the first call fills the cache and the second is served from it.
+
+    Args:
+        fake_redis: Fake Redis client fixture
+    """
+    get_tag, calls = _counting_get_tag()
+
+    first = get_tag(None, 1)
+    second = get_tag(None, 1)
+
+    assert calls == [1]
+    assert second == first
+    assert len(fake_redis.store) == 1
+
+
+def test_cached_key_ignores_positional_or_keyword(fake_redis: FakeRedis) -> None:
+    """Test that positional and keyword calls share one cache entry.
+
+    Args:
+        fake_redis: Fake Redis client fixture
+    """
+    get_tag, calls = _counting_get_tag()
+
+    _ = get_tag(None, 1)
+    _ = get_tag(None, tag_id=1)
+
+    assert calls == [1]
+    assert len(fake_redis.store) == 1
+
+
+def test_cached_falls_back_when_redis_fails(fake_redis: FakeRedis) -> None:
+    """Test that Redis errors are swallowed and every call reaches the database.
+
+    Args:
+        fake_redis: Fake Redis client fixture
+    """
+    get_tag, calls = _counting_get_tag()
+    fake_redis.failing = True
+
+    first = get_tag(None, 1)
+    second = get_tag(None, 1)
+
+    assert calls == [1, 1]
+    assert first == second
+    assert fake_redis.store == {}
+
+
+# ============================================================================
+# Invalidation Tests
+# ============================================================================
+
+
+def test_invalidate_drops_only_matching_prefix(fake_redis: FakeRedis) -> None:
+    """Test that invalidating a prefix keeps entries under other prefixes.
+
+    Args:
+        fake_redis: Fake Redis client fixture
+    """
+    fake_redis.store = {
+        "tags:list:page=1": "a",
+        "tags:get:tag_id=1": "b",
+        "relations:list:page=1": "c",
+    }
+
+    invalidate("tags")
+
+    assert fake_redis.store == {"relations:list:page=1": "c"}
+
+
+def test_invalidate_on_commit_waits_for_commit(
+    fake_redis: FakeRedis, test_db: Session
+) -> None:
+    """Test that queued invalidations run on commit and not before.
+
+    Args:
+        fake_redis: Fake Redis client fixture
+        test_db: Test database session
+    """
+    fake_redis.store = {"tags:list:page=1": "a"}
+
+    invalidate_on_commit(test_db, "tags:list")
+    assert "tags:list:page=1" in fake_redis.store
+
+    test_db.commit()
+    assert fake_redis.store == {}
+
+
+def test_invalidate_on_commit_discarded_on_rollback(
+    fake_redis: FakeRedis, test_db: Session
+) -> None:
+    """Test that a rolled-back write leaves the cache alone, even after later commits.
+
+    Args:
+        fake_redis: Fake Redis client fixture
+        test_db: Test database session
+    """
+    fake_redis.store = {"tags:list:page=1": "a"}
+
+    _ = test_db.connection()
+    invalidate_on_commit(test_db, "tags:list")
+    test_db.rollback()
+    test_db.commit()
+
+    assert fake_redis.store == {"tags:list:page=1": "a"}
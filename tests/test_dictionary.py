@@ -1,8 +1,14 @@
 """Tests for dictionary endpoints."""
 
+from datetime import UTC, datetime
 from typing import Any
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
+from sqlalchemy import text, update
+from sqlalchemy.orm import Session
+
+from db.models.dictionary import Definition, Example, PartOfSpeech, Word
 
 # ============================================================================
 # Word Endpoints Tests
@@ -110,6 +116,29 @@ def test_get_word_by_id(client: TestClient, sample_word_data: dict[str, Any]) ->
     assert "definitions" in data
 
 
+def test_get_word_by_text(client: TestClient, sample_word_data: dict[str, Any]) -> None:
+    """Test getting a word by language and text, flat and with nested data.
+
+    Args:
+        client: FastAPI test client
+        sample_word_data: Sample word data fixture
+    """
+    created = client.post("/v1/dictionary/words", json=sample_word_data).json()
+    path = (
+        f"/v1/dictionary/words/{sample_word_data['language_code']}"
+        f"/{sample_word_data['word_text']}"
+    )
+
+    full = client.get(path)
+    flat = client.get(path, params={"include_all": "false"})
+
+    assert full.status_code == 200
+    assert full.json()["id"] == created["id"]
+    assert "definitions" in full.json()
+    assert flat.json() == created
+    assert client.get("/v1/dictionary/words/fr/absent").status_code == 404
+
+
 def test_get_nonexistent_word(client: TestClient) -> None:
     """Test getting a word that doesn't exist.
 
@@ -185,6 +214,66 @@ def test_search_words(client: TestClient, sample_word_data: dict[str, Any]) -> N
     assert data["data"][0]["word_text"] == sample_word_data["word_text"]
 
 
+def test_search_words_contains(
+    client: TestClient, sample_word_data: dict[str, Any]
+) -> None:
+    """Test substring search, which prefix search does not match.
+
+    Args:
+        client: FastAPI test client
+        sample_word_data: Sample word data fixture
+    """
+    client.post("/v1/dictionary/words", json=sample_word_data)
+
+    prefix = client.get("/v1/dictionary/words?search=MERA").json()
+    contains = client.get("/v1/dictionary/words?search=MERA&contains=true").json()
+
+    assert prefix["total"] == 0
+    assert [w["word_text"] for w in contains["data"]] == [sample_word_data["word_text"]]
+
+
+def test_search_words_by_several_forms_counts_word_once(client: TestClient) -> None:
+    """Test that a word matching through several forms is listed and counted once.
+
+    Args:
+        client: FastAPI test client
+    """
+    client.post(
+        "/v1/dictionary/words",
+        json={
+            "word_text": "defy",
+            "language_code": "en",
+            "word_forms": [{"form_text": "defied"}, {"form_text": "defies"}],
+        },
+    )
+
+    for params in ({}, {"include_all": "true"}):
+        data = client.get(
+            "/v1/dictionary/words", params={"search": "defi", **params}
+        ).json()
+
+        assert data["total"] == 1
+        assert [w["word_text"] for w in data["data"]] == ["defy"]
+
+
+def test_search_words_trims_and_rejects_short_text(
+    client: TestClient, sample_word_data: dict[str, Any]
+) -> None:
+    """Test that search text is trimmed and one-character searches are rejected.
+
+    Args:
+        client: FastAPI test client
+        sample_word_data: Sample word data fixture
+    """
+    client.post("/v1/dictionary/words", json=sample_word_data)
+
+    padded = client.get("/v1/dictionary/words", params={"search": "  eph "})
+    short = client.get("/v1/dictionary/words", params={"search": "e"})
+
+    assert padded.json()["total"] == 1
+    assert short.status_code == 400
+
+
 def test_search_words_no_match(client: TestClient) -> None:
     """Test searching for words with no matches.
 
@@ -218,10 +307,87 @@ def test_bulk_create_words(client: TestClient) -> None:
     data = response.json()
 
     assert len(data) == 3
+    assert [word["word_text"] for word in data] == [w["word_text"] for w in words]
     assert all("id" in word for word in data)
     assert all("created_at" in word for word in data)
 
 
+def test_bulk_create_words_rejects_existing_word(client: TestClient) -> None:
+    """Test that a batch containing a stored word fails without inserting any.
+
+    Args:
+        client: FastAPI test client
+    """
+    client.post(
+        "/v1/dictionary/words", json={"word_text": "beta", "language_code": "en"}
+    )
+    words = [
+        {"word_text": "alpha", "language_code": "en"},
+        {"word_text": "beta", "language_code": "en"},
+    ]
+
+    response = client.post("/v1/dictionary/words", json=words)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Words already exist: beta (en)"
+    assert client.get("/v1/dictionary/words").json()["total"] == 1
+
+
+def test_list_words_keyset_pagination(client: TestClient) -> None:
+    """Test paging through words with the after_id keyset cursor.
+
+    Args:
+        client: FastAPI test client
+    """
+    words = [{"word_text": f"word{i}", "language_code": "en"} for i in range(5)]
+    created = client.post("/v1/dictionary/words", json=words).json()
+    created_ids = [w["id"] for w in created]
+
+    seen: list[int] = []
+    cursor = 0
+    while True:
+        response = client.get(f"/v1/dictionary/words?after_id={cursor}&page_size=2")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen.extend(w["id"] for w in data["data"])
+        if not data["has_more"]:
+            assert data["next_cursor"] is None
+            break
+        cursor = data["next_cursor"]
+
+    assert seen == sorted(created_ids)
+
+
+def test_list_words_alphabetical_cursor_pagination(client: TestClient) -> None:
+    """Test following next_page_cursor through words in alphabetical order.
+
+    Args:
+        client: FastAPI test client
+    """
+    words = [
+        {"word_text": text, "language_code": lang}
+        for text, lang in [("cat", "en"), ("ant", "en"), ("bat", "en"), ("ant", "fr")]
+    ]
+    client.post("/v1/dictionary/words", json=words)
+
+    first = client.get("/v1/dictionary/words?page_size=2").json()
+    assert [w["word_text"] for w in first["data"]] == ["ant", "ant"]
+    assert first["total"] == 4
+
+    second = client.get(
+        "/v1/dictionary/words",
+        params={"page_size": 2, "cursor": first["next_page_cursor"]},
+    ).json()
+    assert [w["word_text"] for w in second["data"]] == ["bat", "cat"]
+    assert second["total"] is None
+    assert second["has_more"] is False
+    assert second["next_page_cursor"] is None
+
+    bad = client.get("/v1/dictionary/words", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+
 # ============================================================================
 # Definition Endpoints Tests
 # ============================================================================
@@ -283,6 +449,59 @@ def test_create_definition_for_nonexistent_word(
     assert response.status_code == 404
 
 
+def test_create_definition_with_duplicate_order(
+    client: TestClient,
+    sample_word_data: dict[str, Any],
+    sample_definition_data: dict[str, Any],
+) -> None:
+    """Test that reusing a definition order for the same word is a conflict.
+
+    Args:
+        client: FastAPI test client
+        sample_word_data: Sample word data fixture
+        sample_definition_data: Sample definition data fixture
+    """
+    word_id = client.post("/v1/dictionary/words", json=sample_word_data).json()["id"]
+    definition_body = {
+        k: v for k, v in sample_definition_data.items() if k != "word_id"
+    }
+    url = f"/v1/dictionary/words/{word_id}/definitions"
+    assert client.post(url, json=definition_body).status_code == 201
+
+    response = client.post(url, json=definition_body)
+
+    assert response.status_code == 409
+
+
+def test_create_definition_for_word_deleted_concurrently(
+    client: TestClient, test_db: Session, sample_definition_data: dict[str, Any]
+) -> None:
+    """Test that a foreign key violation for a vanished word is a 404.
+
+    Drops the EXISTS guard so the insert reaches the foreign key check, as it
+    would when the word is deleted between the guard and the FK check.
+
+    Args:
+        client: FastAPI test client
+        test_db: Test database session
+        sample_definition_data: Sample definition data fixture
+    """
+    test_db.execute(text("PRAGMA foreign_keys = ON"))
+    definition_body = {
+        k: v for k, v in sample_definition_data.items() if k != "word_id"
+    }
+
+    with patch(
+        "api.services.definition_service.insert_where",
+        lambda stmt, values, *_conditions: stmt.values(values),
+    ):
+        response = client.post(
+            "/v1/dictionary/words/99999/definitions", json=definition_body
+        )
+
+    assert response.status_code == 404
+
+
 # ============================================================================
 # Tag Endpoints Tests
 # ============================================================================
@@ -345,6 +564,61 @@ def test_list_tags(client: TestClient, sample_tag_data: dict[str, Any]) -> None:
     assert data["data"][0]["name"] == sample_tag_data["name"]
 
 
+def test_list_tags_keyset_pagination(client: TestClient) -> None:
+    """Test paging through tags with the after_id keyset cursor.
+
+    Args:
+        client: FastAPI test client
+    """
+    for name in ["gamma", "alpha", "beta"]:
+        client.post("/v1/dictionary/tags", json={"name": name})
+
+    first = client.get("/v1/dictionary/tags?after_id=0&page_size=2").json()
+    assert [t["name"] for t in first["data"]] == ["gamma", "alpha"]
+    assert first["has_more"] is True
+
+    second = client.get(
+        f"/v1/dictionary/tags?after_id={first['next_cursor']}&page_size=2"
+    ).json()
+    assert [t["name"] for t in second["data"]] == ["beta"]
+    assert second["has_more"] is False
+    assert second["next_cursor"] is None
+
+
+def test_search_tags_treats_wildcards_literally(client: TestClient) -> None:
+    """Test that % and _ in a tag search match only themselves.
+
+    Args:
+        client: FastAPI test client
+    """
+    for name in ["50%off", "500", "a_b", "axb"]:
+        client.post("/v1/dictionary/tags", json={"name": name})
+
+    percent = client.get("/v1/dictionary/tags", params={"search": "50%"}).json()
+    underscore = client.get("/v1/dictionary/tags", params={"search": "a_"}).json()
+
+    assert [t["name"] for t in percent["data"]] == ["50%off"]
+    assert [t["name"] for t in underscore["data"]] == ["a_b"]
+
+
+def test_get_tag(client: TestClient, sample_tag_data: dict[str, Any]) -> None:
+    """Test getting a tag by ID, and a 404 for an unknown ID.
+
+    Args:
+        client: FastAPI test client
+        sample_tag_data: Sample tag data fixture
+    """
+    created = client.post("/v1/dictionary/tags", json=sample_tag_data).json()
+
+    response = client.get(f"/v1/dictionary/tags/{created['id']}")
+
+    assert response.status_code == 200
+    assert response.json() == created
+
+    missing = client.get("/v1/dictionary/tags/99999")
+    assert missing.status_code == 404
+
+
 # ============================================================================
 # Word-Tag Association Tests
 # ============================================================================
@@ -417,6 +691,102 @@ def test_get_word_with_tags(
     assert data["tags"][0]["name"] == sample_tag_data["name"]
 
 
+def test_list_words_with_definitions_includes_all_nested_data(
+    client: TestClient,
+) -> None:
+    """Test that a nested listing returns every WordFull collection.
+
+    Args:
+        client: FastAPI test client
+    """
+    client.post(
+        "/v1/dictionary/words",
+        json={
+            "word_text": "defy",
+            "language_code": "en",
+            "definitions": [
+                {
+                    "definition_text": "openly resist",
+                    "part_of_speech": "verb",
+                    "examples": [{"example_text": "They defied the order."}],
+                },
+            ],
+            "tags": ["verbs"],
+            "word_forms": [{"form_text": "defied", "form_type": "past"}],
+        },
+    )
+
+    response = client.get("/v1/dictionary/words?include_definitions=true")
+
+    assert response.status_code == 200
+    (word,) = response.json()["data"]
+    assert word["definitions"][0]["examples"][0]["example_text"] == (
+        "They defied the order."
+    )
+    assert [tag["name"] for tag in word["tags"]] == ["verbs"]
+    assert [form["form_text"] for form in word["word_forms"]] == ["defied"]
+
+
+def test_list_words_rejects_cursor_with_after_id(client: TestClient) -> None:
+    """Test that the alphabetical and id keyset cursors cannot be combined.
+
+    Args:
+        client: FastAPI test client
+    """
+    words = [{"word_text": f"word{i}", "language_code": "en"} for i in range(3)]
+    client.post("/v1/dictionary/words", json=words)
+    cursor = client.get("/v1/dictionary/words?page_size=1").json()["next_page_cursor"]
+
+    response = client.get(
+        "/v1/dictionary/words",
+        params={"cursor": cursor, "after_id": 0, "page_size": 1},
+    )
+
+    assert response.status_code == 400
+    assert "not both" in response.json()["detail"]
+
+
+def test_create_word_with_nested_data_matches_get(client: TestClient) -> None:
+    """Test that a nested create returns the same word a later GET does.
+
+    Args:
+        client: FastAPI test client
+    """
+    response = client.post(
+        "/v1/dictionary/words",
+        json={
+            "word_text": "run",
+            "language_code": "en",
+            "definitions": [
+                {
+                    "definition_text": "move fast on foot",
+                    "part_of_speech": "verb",
+                    "examples": [
+                        {"example_text": "She runs daily."},
+                        {"example_text": "Run!", "source": "film"},
+                    ],
+                },
+                {
+                    "definition_text": "a period of running",
+                    "part_of_speech": "noun",
+                    "order": 1,
+                },
+            ],
+            "tags": ["motion", "sport", "motion"],
+            "word_forms": [{"form_text": "ran", "form_type": "past"}],
+        },
+    )
+
+    assert response.status_code == 201
+    created = response.json()
+
+    fetched = client.get(f"/v1/dictionary/words/{created['id']}?include_all=true")
+
+    assert fetched.status_code == 200
+    assert created == fetched.json()
+    assert [tag["name"] for tag in created["tags"]] == ["motion", "sport"]
+
+
 # ============================================================================
 # Tag Name Functionality Tests (Auto-create tags by name)
 # ============================================================================
@@ -566,6 +936,11 @@ def test_bulk_create_words_with_tag_names(client: TestClient) -> None:
     tags_response = client.get("/v1/dictionary/tags")
     assert tags_response.json()["total"] == 3  # medical, profession, healthcare
 
+    # The response is built from the insert results; it must match a fresh read
+    for word in data:
+        fetched = client.get(f"/v1/dictionary/words/{word['id']}?include_all=true")
+        assert fetched.json() == word
+
 
 def test_update_word_with_tag_names(client: TestClient) -> None:
     """Test updating a word with tag names.
@@ -588,6 +963,19 @@ def test_update_word_with_tag_names(client: TestClient) -> None:
     assert len(data["tags"]) == 2
     assert {tag["name"] for tag in data["tags"]} == {"category1", "category2"}
 
+    # Replacing keeps the overlap, drops the rest and adds the new names
+    response = client.patch(
+        f"/v1/dictionary/words/{word_id}", json={"tags": ["category2", "category3"]}
+    )
+    assert {tag["name"] for tag in response.json()["tags"]} == {
+        "category2",
+        "category3",
+    }
+
+    # An empty list removes every tag
+    response = client.patch(f"/v1/dictionary/words/{word_id}", json={"tags": []})
+    assert response.json()["tags"] == []
+
 
 def test_create_word_with_empty_tags_list(client: TestClient) -> None:
     """Test creating a word with empty tags list.
@@ -609,3 +997,90 @@ def test_create_word_with_empty_tags_list(client: TestClient) -> None:
     assert data["word_text"] == "simple"
     # Empty tags returns WordOut (no tags field), not WordFull
     assert "tags" not in data
+
+
+def test_create_duplicate_relation(client: TestClient) -> None:
+    """Test that relating the same word pair twice is rejected.
+
+    Args:
+        client: FastAPI test client
+    """
+    words = client.post(
+        "/v1/dictionary/words",
+        json=[
+            {"word_text": "happy", "language_code": "en"},
+            {"word_text": "glad", "language_code": "en"},
+        ],
+    ).json()
+    relation = {
+        "word_id_1": words[0]["id"],
+        "word_id_2": words[1]["id"],
+        "relation_type": "synonym",
+    }
+
+    response1 = client.post("/v1/dictionary/relations", json=relation)
+    assert response1.status_code == 201
+    assert response1.json() == relation
+
+    response2 = client.post(
+        "/v1/dictionary/relations", json={**relation, "relation_type": "related"}
+    )
+    assert response2.status_code == 400
+    assert "already exists" in response2.json()["detail"]
+
+
+def test_create_relation_for_nonexistent_word(
+    client: TestClient, sample_word_data: dict[str, Any]
+) -> None:
+    """Test that relating a word to a missing word returns 404.
+
+    Args:
+        client: FastAPI test client
+        sample_word_data: Sample word data fixture
+    """
+    word = client.post("/v1/dictionary/words", json=sample_word_data).json()
+
+    response = client.post(
+        "/v1/dictionary/relations",
+        json={"word_id_1": word["id"], "word_id_2": 99999, "relation_type": "synonym"},
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Word 99999 not found"
+
+
+# ============================================================================
+# Word Timestamp Tests
+# ============================================================================
+
+
+def test_flushing_nested_rows_touches_word(test_db: Session) -> None:
+    """Test that ORM changes to definitions and examples bump Word.updated_at.
+
+    Args:
+        test_db: Test database session
+    """
+    stale = datetime(2000, 1, 1, tzinfo=UTC)
+    word = Word(word_text="ephemeral", language_code="en")
+    test_db.add(word)
+    test_db.commit()
+
+    def reset_timestamp() -> None:
+        _ = test_db.execute(update(Word).values(updated_at=stale))
+        test_db.commit()
+        test_db.expire_all()
+
+    reset_timestamp()
+    definition = Definition(
+        word_id=word.id,
+        definition_text="lasting for a very short time",
+        part_of_speech=PartOfSpeech.ADJECTIVE,
+    )
+    test_db.add(definition)
+    test_db.commit()
+    assert word.updated_at.replace(tzinfo=UTC) > stale
+
+    reset_timestamp()
+    test_db.add(Example(definition_id=definition.id, example_text="fleeting"))
+    test_db.commit()
+    assert word.updated_at.replace(tzinfo=UTC) > stale
@@ -1,5 +1,7 @@
 """Tests for health check endpoint."""
 
+from unittest.mock import AsyncMock, patch
+
 from fastapi.testclient import TestClient
 
 from neural_networks.core import NeuralNetwork
@@ -58,3 +60,45 @@ def test_health_check_response_schema(client: TestClient) -> None:
     assert isinstance(data["status"], str)
     assert isinstance(data["network_loaded"], bool)
     assert isinstance(data["database_connected"], bool)
+
+
+def test_health_check_caches_database_probe(client: TestClient) -> None:
+    """Test that repeated health checks within the TTL reuse the last DB probe.
+
+    Args:
+        client: FastAPI test client
+    """
+    from api import main
+
+    main._db_state["ts"] = float("-inf")  # pyright: ignore[reportPrivateUsage]
+
+    with patch.object(main, "_probe_database", AsyncMock(return_value=True)) as probe:
+        first = client.get("/healthz")
+        second = client.get("/healthz")
+
+    assert first.json()["database_connected"] is True
+    assert second.json()["database_connected"] is True
+    assert probe.await_count == 1
+
+
+def test_health_check_reprobes_database_after_ttl(client: TestClient) -> None:
+    """Test that an expired probe result is refreshed with a new DB probe.
+
+    Args:
+        client: FastAPI test client
+    """
+    from api import main
+
+    main._db_state["ts"] = float("-inf")  # pyright: ignore[reportPrivateUsage]
+
+    with patch.object(
+        main, "_probe_database", AsyncMock(side_effect=[True, False])
+    ) as probe:
+        first = client.get("/healthz")
+        # Age the cached result past the TTL
+        main._db_state["ts"] -= main._DB_PROBE_TTL  # pyright: ignore[reportPrivateUsage]
+        second = client.get("/healthz")
+
+    assert first.json()["database_connected"] is True
+    assert second.json()["database_connected"] is False
+    assert probe.await_count == 2
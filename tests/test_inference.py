@@ -1,5 +1,10 @@
 """Tests for inference endpoints (/predict, /activations)."""
 
+import base64
+import json
+
+import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
 from neural_networks.core import NeuralNetwork
@@ -123,6 +128,119 @@ def test_predict_missing_field(client: TestClient, mock_network: NeuralNetwork)
     """
     response = client.post("/v1/predict", json={})
     assert response.status_code == 422  # Validation error
+    assert "pixels" in response.json()["detail"][0]["msg"]
+
+
+def test_predict_base64_pixels_match_list(
+    client: TestClient, mock_network: NeuralNetwork, sample_pixels: list[float]
+) -> None:
+    """Test that base64 float32 pixels predict the same as the JSON list.
+
+    Args:
+        client: FastAPI test client
+        mock_network: Mock neural network
+        sample_pixels: Sample pixel data
+    """
+    blob = np.asarray(sample_pixels, dtype="<f4").tobytes()
+    encoded = base64.b64encode(blob).decode()
+
+    list_response = client.post("/v1/predict", json={"pixels": sample_pixels})
+    b64_response = client.post("/v1/predict", json={"pixels_b64": encoded})
+
+    assert b64_response.status_code == 200
+    assert b64_response.json() == list_response.json()
+
+
+def test_predict_base64_pixels_wrong_size(
+    client: TestClient, mock_network: NeuralNetwork
+) -> None:
+    """Test that a base64 blob of the wrong length is rejected.
+
+    Args:
+        client: FastAPI test client
+        mock_network: Mock neural network
+    """
+    encoded = base64.b64encode(bytes(100)).decode()
+
+    response = client.post("/v1/predict", json={"pixels_b64": encoded})
+
+    assert response.status_code == 422
+
+
+# ============================================================================
+# /predict/batch Endpoint Tests
+# ============================================================================
+
+
+def test_predict_batch_matches_single_predictions(
+    client: TestClient,
+    mock_network: NeuralNetwork,
+    sample_pixels: list[float],
+    zero_pixels: list[float],
+) -> None:
+    """Test batched prediction returns the same results as /predict per input.
+
+    Args:
+        client: FastAPI test client
+        mock_network: Mock neural network
+        sample_pixels: Sample pixel data
+        zero_pixels: All-zero pixel data
+    """
+    response = client.post(
+        "/v1/predict/batch", json={"pixels": [sample_pixels, zero_pixels]}
+    )
+
+    assert response.status_code == 200
+    predictions = response.json()["predictions"]
+    assert len(predictions) == 2
+
+    for pixels, prediction in zip(
+        [sample_pixels, zero_pixels], predictions, strict=True
+    ):
+        single = client.post("/v1/predict", json={"pixels": pixels}).json()
+        assert prediction["predicted_digit"] == single["predicted_digit"]
+        assert prediction["confidence"] == pytest.approx(single["confidence"])
+        assert prediction["probabilities"] == pytest.approx(single["probabilities"])
+
+
+def test_predict_batch_without_network(
+    client: TestClient, sample_pixels: list[float]
+) -> None:
+    """Test batched prediction when network is not loaded.
+
+    Args:
+        client: FastAPI test client
+        sample_pixels: Sample pixel data
+    """
+    from api.state import state
+
+    original_network = state.network
+    state.network = None
+
+    try:
+        response = client.post("/v1/predict/batch", json={"pixels": [sample_pixels]})
+        assert response.status_code == 503
+    finally:
+        state.network = original_network
+
+
+def test_predict_batch_invalid_input(
+    client: TestClient, mock_network: NeuralNetwork, sample_pixels: list[float]
+) -> None:
+    """Test batched prediction rejects empty batches and wrong-sized images.
+
+    Args:
+        client: FastAPI test client
+        mock_network: Mock neural network
+        sample_pixels: Sample pixel data
+    """
+    response = client.post("/v1/predict/batch", json={"pixels": []})
+    assert response.status_code == 422
+
+    response = client.post(
+        "/v1/predict/batch", json={"pixels": [sample_pixels, [0.0] * 100]}
+    )
+    assert response.status_code == 422
 
 
 # ============================================================================
@@ -194,6 +312,52 @@ def test_activations_with_network(
         assert all(isinstance(val, float) for val in activation)
 
 
+def test_activations_ndjson_stream(
+    client: TestClient, mock_network: NeuralNetwork, sample_pixels: list[float]
+) -> None:
+    """Test that activations stream as NDJSON when requested via Accept.
+
+    Args:
+        client: FastAPI test client
+        mock_network: Mock neural network
+        sample_pixels: Sample pixel data
+    """
+    response = client.post(
+        "/v1/activations",
+        json={"pixels": sample_pixels},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["layer"] for line in lines] == list(range(len(mock_network.sizes)))
+    for line, size in zip(lines, mock_network.sizes, strict=True):
+        assert len(line["values"]) == size
+
+
+def test_activations_gzip_compressed(
+    client: TestClient, mock_network: NeuralNetwork, sample_pixels: list[float]
+) -> None:
+    """Test that activations are gzip-compressed when the client accepts it.
+
+    Args:
+        client: FastAPI test client
+        mock_network: Mock neural network
+        sample_pixels: Sample pixel data
+    """
+    response = client.post(
+        "/v1/activations",
+        json={"pixels": sample_pixels},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["activations"]) == len(mock_network.sizes)
+
+
 def test_activations_with_zeros(
     client: TestClient, mock_network: NeuralNetwork, zero_pixels: list[float]
 ) -> None:
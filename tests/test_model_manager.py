@@ -0,0 +1,115 @@
+"""Tests for resolving model files through the Hugging Face Hub cache."""
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from huggingface_hub.utils import LocalEntryNotFoundError
+
+from hf_hub.model_manager import ModelManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> ModelManager:
+    """Create a model manager with a temporary cache directory.
+
+    Args:
+        tmp_path: Pytest temporary directory
+
+    Returns:
+        Model manager for a dummy repository
+    """
+    return ModelManager(repo_id="user/models", cache_dir=tmp_path, token=None)
+
+
+@pytest.fixture
+def hub_download() -> Generator[MagicMock]:
+    """Replace ``hf_hub_download`` so no test touches the network.
+
+    Yields:
+        Mock standing in for ``hf_hub_download``
+    """
+    with patch("hf_hub.model_manager.hf_hub_download") as mock:
+        mock.return_value = "/cache/model.npz"
+        yield mock
+
+
+def _local_only(call: Any) -> bool:
+    """Whether a recorded ``hf_hub_download`` call was restricted to the cache."""
+    return call.kwargs.get("local_files_only", False)
+
+
+def test_download_model_checks_hub_outside_production(
+    manager: ModelManager, hub_download: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that development fetches go to the Hub without a cache-only attempt.
+
+    Args:
+        manager: Model manager fixture
+        hub_download: Mocked ``hf_hub_download``
+        monkeypatch: Pytest environment patcher
+    """
+    monkeypatch.delenv("ENV", raising=False)
+    monkeypatch.delenv("HF_PREFER_CACHE", raising=False)
+
+    model_path, metadata_path = manager.download_model("mnist")
+
+    assert model_path == metadata_path == Path("/cache/model.npz")
+    assert hub_download.call_count == 2
+    assert not any(_local_only(call) for call in hub_download.call_args_list)
+
+
+def test_download_model_uses_cache_in_production(
+    manager: ModelManager, hub_download: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that production serves cached files without contacting the Hub.
+
+    Args:
+        manager: Model manager fixture
+        hub_download: Mocked ``hf_hub_download``
+        monkeypatch: Pytest environment patcher
+    """
+    monkeypatch.setenv("ENV", "production")
+
+    _ = manager.download_model("mnist")
+
+    assert hub_download.call_count == 2
+    assert all(_local_only(call) for call in hub_download.call_args_list)
+
+
+@pytest.mark.parametrize(
+    ("env", "value"), [("ENV", "production"), ("HF_PREFER_CACHE", "1")]
+)
+def test_fetch_falls_back_to_hub_on_cache_miss(
+    manager: ModelManager,
+    hub_download: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    env: str,
+    value: str,
+) -> None:
+    """Test that a cache miss under cache-first mode downloads from the Hub.
+
+    Args:
+        manager: Model manager fixture
+        hub_download: Mocked ``hf_hub_download``
+        monkeypatch: Pytest environment patcher
+        env: Variable that enables cache-first resolution
+        value: Value enabling it
+    """
+    monkeypatch.delenv("ENV", raising=False)
+    monkeypatch.setenv(env, value)
+    miss = LocalEntryNotFoundError("not cached")
+    hub_download.side_effect = [miss, "/cache/model.npz", miss, "/cache/model.json"]
+
+    model_path, metadata_path = manager.download_model("mnist")
+
+    assert model_path == Path("/cache/model.npz")
+    assert metadata_path == Path("/cache/model.json")
+    assert [_local_only(call) for call in hub_download.call_args_list] == [
+        True,
+        False,
+        True,
+        False,
+    ]
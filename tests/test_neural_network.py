@@ -0,0 +1,120 @@
+"""Tests for network training, evaluation and the MNIST array loader."""
+
+from typing import Literal
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from neural_networks.core import NDArrayFloat, NeuralNetwork
+from neural_networks.mnist_loader import MNISTLoader
+
+
+def _one_hot(labels: list[int], classes: int) -> NDArrayFloat:
+    """Encode labels as float32 one-hot rows."""
+    return np.eye(classes, dtype=np.float32)[labels]
+
+
+# ============================================================================
+# Backpropagation Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize("activation", ["sigmoid", "relu"])
+def test_backprop_batch_equals_summed_per_sample(
+    activation: Literal["sigmoid", "relu"],
+) -> None:
+    """Test that one batched backward pass sums the per-sample gradients.
+
+    Args:
+        activation: Hidden and output activation function
+    """
+    rng = np.random.default_rng(0)
+    network = NeuralNetwork([4, 5, 3], activation=activation)
+    x = rng.random((4, 6), dtype=np.float32)
+    y = _one_hot([0, 1, 2, 0, 1, 2], 3).T
+
+    backprop = network._backprop  # pyright: ignore[reportPrivateUsage]
+
+    nabla_b, nabla_w = backprop(x, y)
+    per_sample = [backprop(x[:, [i]], y[:, [i]]) for i in range(x.shape[1])]
+
+    for layer, (b, w) in enumerate(zip(nabla_b, nabla_w, strict=True)):
+        assert b.shape == network.biases[layer].shape
+        assert w.shape == network.weights[layer].shape
+        summed_b = sum(sample_b[layer] for sample_b, _ in per_sample)
+        summed_w = sum(sample_w[layer] for _, sample_w in per_sample)
+        np.testing.assert_allclose(b, summed_b, rtol=1e-4, atol=1e-6)
+        np.testing.assert_allclose(w, summed_w, rtol=1e-4, atol=1e-6)
+
+
+# ============================================================================
+# Training and Evaluation Tests
+# ============================================================================
+
+
+def test_train_arrays_one_epoch_smoke() -> None:
+    """Test that one epoch over arrays updates parameters and reports accuracy."""
+    rng = np.random.default_rng(0)
+    inputs = rng.random((10, 4), dtype=np.float32)
+    targets = _one_hot([i % 3 for i in range(10)], 3)
+    network = NeuralNetwork([4, 5, 3])
+    weights_before = [w.copy() for w in network.weights]
+
+    # A batch size that does not divide the sample count exercises the tail batch
+    history = network.train_arrays(
+        inputs,
+        targets,
+        epochs=1,
+        mini_batch_size=4,
+        learning_rate=0.5,
+        test_data=(inputs, targets),
+    )
+
+    assert history == [
+        {
+            "epoch": 1,
+            "test_accuracy": network.evaluate_arrays(inputs, targets),
+            "test_total": 10,
+        }
+    ]
+    for before, after in zip(weights_before, network.weights, strict=True):
+        assert after.dtype == np.float32
+        assert not np.array_equal(before, after)
+
+
+def test_evaluate_arrays_counts_argmax_matches() -> None:
+    """Test that evaluation counts the same correct predictions in any batch size."""
+    rng = np.random.default_rng(0)
+    inputs = rng.random((7, 4), dtype=np.float32)
+    network = NeuralNetwork([4, 3])
+    predicted = network.feedforward(inputs.T).argmax(axis=0)
+    # Two right, five wrong
+    labels = [int(p) if i < 2 else (int(p) + 1) % 3 for i, p in enumerate(predicted)]
+    targets = _one_hot(labels, 3)
+
+    assert network.evaluate_arrays(inputs, targets) == 2
+    assert network.evaluate_arrays(inputs, targets, batch_size=3) == 2
+
+
+# ============================================================================
+# MNIST Loader Tests
+# ============================================================================
+
+
+def test_load_arrays_returns_contiguous_float32() -> None:
+    """Test that each split becomes float32 inputs and one-hot float32 labels."""
+    inputs = np.random.default_rng(0).random((3, 784))
+    labels = np.array([3, 0, 9])
+    split = (inputs, labels)
+
+    with patch.object(MNISTLoader, "_load_raw", return_value=(split, split, split)):
+        training, _, _ = MNISTLoader.load_arrays()
+
+    train_inputs, train_labels = training
+    assert train_inputs.dtype == np.float32
+    assert train_inputs.flags.c_contiguous
+    np.testing.assert_allclose(train_inputs, inputs, rtol=1e-6)
+    assert train_labels.dtype == np.float32
+    assert train_labels.shape == (3, 10)
+    assert train_labels.argmax(axis=1).tolist() == [3, 0, 9]
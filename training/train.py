@@ -43,24 +43,27 @@ def train_network(
     if seed is not None:
         np.random.seed(seed)
 
-    # Load MNIST data
-    training_data, _validation_data, test_data = MNISTLoader.load_data()
+    # Load MNIST data as contiguous arrays
+    (inputs, targets), _validation_data, (test_inputs, test_targets) = (
+        MNISTLoader.load_arrays()
+    )
 
     # Create network
     network = NeuralNetwork(sizes=sizes, activation=activation)
 
     # Train
-    network.train(
-        training_data=training_data,
+    network.train_arrays(
+        inputs=inputs,
+        targets=targets,
         epochs=epochs,
         mini_batch_size=mini_batch_size,
         learning_rate=learning_rate,
-        test_data=test_data,
+        test_data=(test_inputs, test_targets),
     )
 
     # Evaluate final accuracy
-    final_accuracy_count = network.evaluate(test_data)
-    final_accuracy_percent = (final_accuracy_count / len(test_data)) * 100
+    final_accuracy_count = network.evaluate_arrays(test_inputs, test_targets)
+    final_accuracy_percent = (final_accuracy_count / len(test_inputs)) * 100
 
     return network, final_accuracy_percent
 